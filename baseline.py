@@ -0,0 +1,95 @@
+''' Compare benchmark results against a stored baseline report, to catch solvers that got slower, use more memory,
+    or started giving different answers. '''
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_MEMORY_TOLERANCE = 0.10
+
+## Differences below these are noise, however large they are relatively
+MIN_SECONDS = 0.005
+MIN_BYTES = 1 << 16
+
+Key = Tuple[int, int, str]
+
+@dataclass
+class Change:
+    ''' How one measurement of a (day, size, part) differs from the baseline. '''
+    day: int
+    size: int
+    part: str
+    metric: str
+    baseline: Any
+    current: Any
+    regressed: bool
+
+def load(path : str) -> List[Dict[str, Any]]:
+    ''' Read the results of a benchmark report. '''
+    with open(path) as f:
+        return json.load(f)['results']
+
+def index(records : List[Dict[str, Any]]) -> Dict[Key, Dict[str, Any]]:
+    ''' Key the measurements of every phase of every benchmark record by (day, size, phase). '''
+    entries = dict()
+    for record in records:
+        for part, seconds in record['timings'].items():
+            entries[(record['day'], record['size'], part)] = {
+                'seconds': seconds,
+                'peak_memory': record.get('peak_memory', {}).get(part),
+                'answer': record.get('answers', {}).get(part),
+            }
+    return entries
+
+def grew(baseline : Optional[float], current : Optional[float], tolerance : float, minimum : float) -> bool:
+    ''' Did a measurement grow by more than the tolerated fraction (and by more than the noise floor)? '''
+    if baseline is None or current is None:
+        return False
+    return current > baseline * (1 + tolerance) and current - baseline > minimum
+
+def compare(baseline : List[Dict[str, Any]], current : List[Dict[str, Any]], tolerance : float = DEFAULT_TOLERANCE,
+        memory_tolerance : float = DEFAULT_MEMORY_TOLERANCE) -> List[Change]:
+    ''' Compare every (day, size, phase) measured in both the baseline and the current results. '''
+    baseline_entries = index(baseline)
+    changes = []
+
+    for key, now in sorted(index(current).items()):
+        before = baseline_entries.get(key)
+        if before is None:
+            continue
+
+        changes.append(Change(*key, 'seconds', before['seconds'], now['seconds'],
+            grew(before['seconds'], now['seconds'], tolerance, MIN_SECONDS)))
+        if before['peak_memory'] is not None and now['peak_memory'] is not None:
+            changes.append(Change(*key, 'peak_memory', before['peak_memory'], now['peak_memory'],
+                grew(before['peak_memory'], now['peak_memory'], memory_tolerance, MIN_BYTES)))
+        if before['answer'] != now['answer']:
+            changes.append(Change(*key, 'answer', before['answer'], now['answer'], True))
+
+    return changes
+
+def format_value(metric : str, value : Any) -> str:
+    ''' Format a measurement for the comparison table. '''
+    if metric == 'seconds':
+        return f'{value * 1000:.1f} ms'
+    if metric == 'peak_memory':
+        return f'{value / (1 << 20):.2f} MiB'
+    return str(value)
+
+def format_changes(changes : List[Change]) -> str:
+    ''' Render the comparison as a table, regressions marked and listed at the end. '''
+    rows = [f'{"day":>3} {"size":>7} {"part":>9} {"metric":>12} {"baseline":>14} {"current":>14} {"change":>8}']
+    for change in changes:
+        if change.metric == 'answer':
+            ratio = 'differs'
+        elif change.baseline:
+            ratio = f'{change.current / change.baseline - 1:+.0%}'
+        else:
+            ratio = ''
+        rows.append(f'{change.day:>3} {change.size:>7} {change.part:>9} {change.metric:>12} '
+            f'{format_value(change.metric, change.baseline):>14} {format_value(change.metric, change.current):>14} '
+            f'{ratio:>8}' + ('  REGRESSION' if change.regressed else ''))
+
+    regressions = sum(change.regressed for change in changes)
+    rows.append(f'{regressions} regression(s) in {len(changes)} comparison(s)')
+    return '\n'.join(rows)
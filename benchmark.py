@@ -0,0 +1,131 @@
+''' Benchmark every day's solvers on seeded synthetic inputs of increasing size and write a JSON report.
+
+    Usage: python benchmark.py [DAY ...] [--seed N] [--quick] [--repeat N] [--no-memory] [--queues] [--output PATH]
+                               [--save-baseline PATH] [--compare PATH [--tolerance F] [--memory-tolerance F]] '''
+import argparse
+import importlib
+import io
+import json
+import platform
+import shutil
+import sys
+import time
+from copy import deepcopy
+from typing import Any, Dict, List, Optional
+
+import baseline
+import generators
+from pqueue import QUEUES
+from runner import BOTH, DAYS, PARTS, format_bytes, format_ms, load, run_day, timed_load
+
+## Solvers benchmarked instead of the two parts: day 19's parts each solve both, and day 23's only handle burrows
+## of one depth each
+BENCH_PARTS = {19: (BOTH,), 23: ('organize',)}
+
+## Days left out unless asked for by name: z3 takes minutes on every day 24 program
+SLOW_DAYS = {24}
+
+## Heavy dependencies several days import lazily, imported before anything is timed so that the first phase to
+## use one isn't charged for importing it, whichever days ran before
+LAZY_DEPENDENCIES = ('numpy',)
+
+## Solvers that take the kind of priority queue (see pqueue) as their queue argument
+QUEUE_SOLVERS = {15: ('part1', 'part2'), 23: ('organize',)}
+
+def bench(day : int, size : int, seed : int = 0, memory : bool = True, repeat : int = 1) -> Dict[str, Any]:
+    ''' Time a day's solvers (and measure their memory use) on a synthetic input of the given size, keeping the
+        best time of each phase over the repeats. '''
+    for name in LAZY_DEPENDENCIES:
+        importlib.import_module(name)
+
+    ## some generators use the day's own code, so the day is imported (and timed) before its input is generated
+    _module, import_seconds = timed_load(day)
+    text = generators.generate(day, size, seed)
+    result = run_day(day, io.StringIO(text), BENCH_PARTS.get(day, PARTS), memory)
+    timings = result.timings
+    for _ in range(repeat - 1):
+        rerun = run_day(day, io.StringIO(text), BENCH_PARTS.get(day, PARTS))
+        timings = dict((phase, min(seconds, rerun.timings[phase])) for phase, seconds in timings.items())
+    timings['import'] = import_seconds
+
+    return {
+        'day': day,
+        'size': size,
+        'input_bytes': len(text),
+        'timings': timings,
+        'peak_memory': result.peak_memory,
+        'net_memory': result.net_memory,
+        'answers': dict((part, str(answer)) for part, answer in result.answers.items()),
+        'memo': dict((name, vars(stats)) for name, stats in result.memo.items()),
+    }
+
+def bench_queues(day : int, size : int, seed : int = 0, repeat : int = 1) -> Dict[str, Any]:
+    ''' Time a day's shortest path solvers with every kind of priority queue on a synthetic input of the given
+        size, keeping the best time of each over the repeats. Phases are named solver/queue. '''
+    text = generators.generate(day, size, seed)
+    module = load(day)
+    args = module.parse(io.StringIO(text))
+
+    timings, answers = dict(), dict()
+    for solver in QUEUE_SOLVERS[day]:
+        for queue in QUEUES:
+            phase = f'{solver}/{queue}'
+            for _ in range(repeat):
+                solver_args = deepcopy(args)
+                start = time.perf_counter()
+                answers[phase] = str(getattr(module, solver)(*solver_args, queue=queue))
+                seconds = time.perf_counter() - start
+                timings[phase] = min(seconds, timings.get(phase, seconds))
+
+    return {'day': day, 'size': size, 'input_bytes': len(text), 'timings': timings, 'peak_memory': {}, 'net_memory': {}, 'answers': answers}
+
+def main(argv : Optional[List[str]] = None) -> None:
+    ''' Command line entry point. '''
+    parser = argparse.ArgumentParser(description='Benchmark Advent of Code 2021 solutions on synthetic inputs.')
+    parser.add_argument('days', metavar='DAY', type=int, nargs='*', help='days to benchmark (default: all but day 24)')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the input generators')
+    parser.add_argument('--quick', action='store_true', help='only benchmark the smallest size of each day')
+    parser.add_argument('--repeat', type=int, default=1, help='run every benchmark this many times and keep the best times')
+    parser.add_argument('--no-memory', action='store_true', help='skip measuring memory, which runs every solver twice')
+    parser.add_argument('--queues', action='store_true', help='compare the priority queues of the shortest path days (15 and 23) instead')
+    parser.add_argument('--output', default='benchmark.json', help='where to write the report')
+    parser.add_argument('--save-baseline', metavar='PATH', help='also save the report as a baseline to compare against later')
+    parser.add_argument('--compare', metavar='PATH', help='compare against a baseline, exiting with status 1 on any regression')
+    parser.add_argument('--tolerance', type=float, default=baseline.DEFAULT_TOLERANCE, help='fraction by which a time may grow (default: %(default)s)')
+    parser.add_argument('--memory-tolerance', type=float, default=baseline.DEFAULT_MEMORY_TOLERANCE, help='fraction by which peak memory may grow (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    days = args.days or [day for day in DAYS if day not in SLOW_DAYS]
+    if args.queues:
+        days = args.days or list(QUEUE_SOLVERS)
+    for day in days:
+        if day not in (QUEUE_SOLVERS if args.queues else DAYS):
+            parser.error(f'no such day: {day}')
+
+    records = []
+    for day in days:
+        sizes = generators.SIZES[day][:1] if args.quick else generators.SIZES[day]
+        for size in sizes:
+            if args.queues:
+                record = bench_queues(day, size, args.seed, args.repeat)
+            else:
+                record = bench(day, size, args.seed, not args.no_memory, args.repeat)
+            records.append(record)
+            timings = '  '.join(f'{phase} {format_ms(seconds)}' for phase, seconds in record['timings'].items())
+            peaks = ''.join(f'  {part} peak {format_bytes(peak)}' for part, peak in record['peak_memory'].items())
+            print(f'day {day:>2}  size {size:>6}  {timings}{peaks}', flush=True)
+
+    report = {'python': platform.python_version(), 'seed': args.seed, 'results': records}
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    if args.save_baseline:
+        shutil.copyfile(args.output, args.save_baseline)
+
+    if args.compare:
+        changes = baseline.compare(baseline.load(args.compare), records, args.tolerance, args.memory_tolerance)
+        print(baseline.format_changes(changes))
+        if any(change.regressed for change in changes):
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+''' On-disk cache of answers, keyed by the content of everything that determines them (the puzzle input and the
+    solver's source), so unchanged days don't need to be solved again. '''
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterable, Optional
+
+DEFAULT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'answers')
+DEFAULT_MAX_BYTES = 1 << 20
+
+def digest(paths : Iterable[str]) -> str:
+    ''' Hash the contents of the given files into a single key. '''
+    sha = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            content = f.read()
+        ## length-prefix every file so moving bytes from one file into the next changes the key
+        sha.update(len(content).to_bytes(8, 'little'))
+        sha.update(content)
+    return sha.hexdigest()
+
+class AnswerCache:
+    ''' Content-addressed answers, one JSON file per key. Once the files add up to more than max_bytes, the least
+        recently used ones are evicted. '''
+    def __init__(self, directory : str = DEFAULT_DIR, max_bytes : int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def path(self, key : str) -> str:
+        ''' File holding the answers for a key. '''
+        return os.path.join(self.directory, f'{key}.json')
+
+    def get(self, key : str) -> Optional[Dict[str, Any]]:
+        ''' The answers stored under a key, or None if there are none. '''
+        try:
+            with open(self.path(key)) as f:
+                answers = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        ## mark as recently used for eviction
+        os.utime(self.path(key))
+        return answers
+
+    def put(self, key : str, answers : Dict[str, Any]) -> None:
+        ''' Store the answers under a key, then evict old entries if the cache has grown too big. '''
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self.path(key) + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(answers, f)
+        os.replace(tmp_path, self.path(key))
+        self.evict()
+
+    def evict(self) -> None:
+        ''' Remove least recently used entries until the cache fits in max_bytes. '''
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.json'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _mtime, size, _path in entries)
+        for _mtime, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+    def clear(self) -> None:
+        ''' Remove every entry. '''
+        if os.path.isdir(self.directory):
+            for entry in os.scandir(self.directory):
+                os.remove(entry.path)
@@ -1,14 +1,70 @@
-from typing import List
+from collections import deque
+from itertools import accumulate, islice, tee
+from operator import gt
+from typing import Iterable, List, Sequence, Tuple, TextIO, TYPE_CHECKING
+
+from parsing import ints
+
+if TYPE_CHECKING:
+	import numpy
+
+def count_increases(depths : Iterable[int], k : int = 1) -> int:
+	''' Count the sums of k consecutive depths that are larger than the previous sum. Adjacent windows share all but
+		their ends, so that's how many depths beat the one k places before them. Works on a list or a stream of depths
+		alike, holding only the last k in memory. '''
+	if k < 1:
+		raise ValueError(f'window size must be positive, got {k}')
+
+	later, earlier = tee(depths)
+	return sum(map(gt, islice(later, k, None), earlier))
+
+def array_increases(depths : 'numpy.ndarray', k : int = 1) -> int:
+	''' count_increases vectorized over a NumPy array of depths, comparing every depth to the one k places before
+		it in a single operation. NumPy is only imported here. '''
+	import numpy as np
+
+	if k < 1:
+		raise ValueError(f'window size must be positive, got {k}')
+	return int(np.count_nonzero(depths[k:] > depths[:-k]))
+
+def window_increases(depths : Iterable[int], sizes : Sequence[int]) -> Tuple[int, ...]:
+	''' count_increases for several window sizes at once, in a single pass over a stream of depths. Every size gets
+		a running count of its increases, all advanced in lockstep, so the stream is only buffered as far back as the
+		largest window. '''
+	if min(sizes) < 1:
+		raise ValueError(f'window sizes must be positive, got {sizes}')
+
+	## largest windows first: they have the fewest comparisons, so zip stops on them before consuming the others
+	order = sorted(range(len(sizes)), key=lambda i: -sizes[i])
+	copies = iter(tee(depths, 2 * len(sizes)))
+	running = [accumulate(map(gt, islice(later, sizes[i], None), earlier), initial=0) for i, later, earlier in zip(order, copies, copies)]
+	last, = deque(zip(*running), maxlen=1)
+
+	counts = [0] * len(sizes)
+	for i, total, rest in zip(order, last, running):
+		rest = deque(rest, maxlen=1)
+		counts[i] = rest[0] if rest else total
+
+	return tuple(counts)
 
 def part1(nums : List[int]) -> int:
 	''' Solve part 1. '''
-	return sum(nums[i] > nums[i - 1] for i in range(1, len(nums)))
+	return count_increases(nums, 1)
 
 def part2(nums : List[int]) -> int:
 	''' Solve part 2. '''
-	return sum(sum(nums[i:i+3]) > sum(nums[i-1:i+2]) for i in range(1, len(nums) - 2))
+	return count_increases(nums, 3)
+
+def stream(lines : Iterable[str]) -> Tuple[int, int]:
+	''' Solve both parts from a stream of lines, remembering only the last three depths. '''
+	return window_increases(map(int, filter(str.strip, lines)), (1, 3))
+
+def parse(f : TextIO) -> Tuple[List[int]]:
+	''' Parse the puzzle input into the arguments taken by each part. '''
+	return (ints(f.read()),)
 
-with open('input/day01.txt') as f:
-	lines = [int(line.rstrip('\n')) for line in f.readlines()]
-	print(part1(lines))
-	print(part2(lines))
\ No newline at end of file
+if __name__ == '__main__':
+	with open('input/day01.txt') as f:
+		args = parse(f)
+	print(part1(*args))
+	print(part2(*args))
\ No newline at end of file
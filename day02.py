@@ -1,39 +1,110 @@
-from typing import List
+from itertools import islice
+from typing import Iterable, Iterator, Tuple, TextIO, TYPE_CHECKING
 
-def part1(moves : List[str]) -> int:
+if TYPE_CHECKING:
+	import numpy
+
+## Opcodes are the commands' first letters, and streams are encoded this many lines at a time
+FORWARD, DOWN, UP = b'fdu'
+CHUNK_LINES = 1 << 16
+
+## Bound on the magnitude of the int64 values a chunk is run with
+INT64_LIMIT = 1 << 63
+
+## Deletes everything from the commands but their magnitudes and the whitespace around them
+DIRECTION_LETTERS = bytes(set(b'forwarddownup'))
+
+Commands = Tuple['numpy.ndarray', 'numpy.ndarray']
+
+def encode(text : str) -> Commands:
+	''' Encode commands as an array of opcodes and one of magnitudes, without a Python loop over them. A command's
+		opcode is the first letter of its direction, the only letter not preceded by another one. Magnitudes too large
+		for int64 are kept as Python ints in an object array. '''
+	import numpy as np
+
+	text = text.encode('ascii')
+	chars = np.frombuffer(text, dtype=np.uint8)
+	letters = (chars >= ord('a')) & (chars <= ord('z'))
+	opcodes = chars[letters & ~np.concatenate(([False], letters[:-1]))]
+	digits = text.translate(None, DIRECTION_LETTERS)
+	## fromstring reads whitespace alone as a single 0
+	magnitudes = np.fromstring(digits, dtype=np.int64, sep=' ') if digits.strip() else np.zeros(0, dtype=np.int64)
+	## fromstring saturates magnitudes too large for int64 instead of failing
+	if len(magnitudes) and magnitudes.max() == INT64_LIMIT - 1:
+		magnitudes = np.array(list(map(int, digits.split())), dtype=object)
+	if len(opcodes) != len(magnitudes):
+		raise ValueError(f'{len(opcodes)} directions but {len(magnitudes)} magnitudes')
+
+	return opcodes, magnitudes
+
+def interpret(chunks : Iterable[Commands]) -> Tuple[int, int, int]:
+	''' Run chunks of encoded commands, returning the final horizontal position, the depth of part 1 and the depth
+		of part 2. Within a chunk there is no branching on the commands: aim is the cumulative sum of the ups and
+		downs, part 2's depth grows by the aim times every forward, and part 1's depth, which is the aim except that
+		it can't go above the surface, ends up as the aim less its lowest value below zero (if it ever was). NumPy is
+		imported lazily, here and in encode. '''
+	import numpy as np
+
+	x = depth = aim = lowest_aim = 0
+	for opcodes, magnitudes in chunks:
+		if not len(opcodes):
+			continue
+
+		## the chunk's own aims and their products with its forwards are bounded by (length * largest magnitude)^2,
+		## past the range of int64 they are computed exactly on Python ints instead
+		bound = len(magnitudes) * int(magnitudes.max())
+		if bound * bound >= INT64_LIMIT:
+			magnitudes = magnitudes.astype(object)
+
+		forwards = np.where(opcodes == FORWARD, magnitudes, 0)
+		aims = np.cumsum(np.where(opcodes == DOWN, magnitudes, 0) - np.where(opcodes == UP, magnitudes, 0))
+		## the aim carried over from earlier chunks multiplies the chunk's forwards as a Python int
+		forward_sum = int(forwards.sum())
+		x += forward_sum
+		depth += aim * forward_sum + int(np.dot(aims, forwards))
+		aim, lowest_aim = aim + int(aims[-1]), min(lowest_aim, aim + int(aims.min()))
+
+	return x, aim - lowest_aim, depth
+
+def split(commands : Commands) -> Iterator[Commands]:
+	''' Split encoded commands into chunks of CHUNK_LINES commands. '''
+	opcodes, magnitudes = commands
+	for i in range(0, len(opcodes), CHUNK_LINES):
+		yield opcodes[i:i + CHUNK_LINES], magnitudes[i:i + CHUNK_LINES]
+
+def part1(commands : Commands) -> int:
 	''' Solve part 1. '''
-	x = y = 0
-	for move in moves:
-		direction, magnitude = move.split()
-		magnitude = int(magnitude)
-
-		if direction == 'forward':
-			x += magnitude
-		elif direction == 'down':
-			y += magnitude
-		elif direction == 'up':
-			y = max(0, y - magnitude)
-	
+	x, y, _depth = interpret(split(commands))
 	return x * y
 
-def part2(moves : List[str]) -> int:
+def part2(commands : Commands) -> int:
 	''' Solve part 2. '''
-	x = y = aim = 0
-	for move in moves:
-		direction, magnitude = move.split()
-		magnitude = int(magnitude)
-
-		if direction == 'forward':
-			x += magnitude
-			y += aim * magnitude
-		elif direction == 'down':
-			aim += magnitude
-		elif direction == 'up':
-			aim -= magnitude
-	
-	return x * y
+	x, _y, depth = interpret(split(commands))
+	return x * depth
+
+def solve_both(commands : Commands) -> Tuple[int, int]:
+	''' Solve both parts in a single pass over the commands. '''
+	x, y, depth = interpret(split(commands))
+	return x * y, x * depth
+
+def chunks(lines : Iterable[str]) -> Iterator[Commands]:
+	''' Encode a stream of lines CHUNK_LINES at a time. '''
+	lines = iter(lines)
+	while batch := list(islice(lines, CHUNK_LINES)):
+		## lines read from a file keep their newlines, doubling them up only adds blank lines
+		yield encode('\n'.join(batch))
+
+def stream(lines : Iterable[str]) -> Tuple[int, int]:
+	''' Solve both parts from a stream of lines, holding one chunk of encoded commands at a time. '''
+	x, y, depth = interpret(chunks(lines))
+	return x * y, x * depth
+
+def parse(f : TextIO) -> Tuple[Commands]:
+	''' Parse the puzzle input into the arguments taken by each part. '''
+	return (encode(f.read()),)
 
-with open('input/day02.txt') as f:
-	lines = [line.rstrip('\n') for line in f.readlines()]
-	print(part1(lines))
-	print(part2(lines))
\ No newline at end of file
+if __name__ == '__main__':
+	with open('input/day02.txt') as f:
+		args = parse(f)
+	print(part1(*args))
+	print(part2(*args))
\ No newline at end of file
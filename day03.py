@@ -1,61 +1,135 @@
-from typing import List
 from collections import Counter
+from itertools import repeat
+from typing import Iterable, List, Tuple, TextIO, TYPE_CHECKING
 
-def invert(bit : str) -> str:
-	''' Returns the inversion of a bit. '''
-	return '1' if bit == '0' else '0'
+if TYPE_CHECKING:
+	import numpy
 
-def get_gamma(binary_nums : List[str]) -> List[str]:
-	''' Returns the gamma from the given list of binary numbers, as a list of characters for flexibility. '''
-	bit_length = len(binary_nums[0])
+def most_common_bit(ones : int, total : int) -> int:
+	''' The most common bit of a column with the given number of 1 bits, 1 if it's a tie. '''
+	return 0 if total - ones > ones else 1
 
-	gamma = []
-	for i in range(bit_length):
-		bit_counter = Counter(num[i] for num in binary_nums)
-		if bit_counter['0'] > bit_counter['1']:
-			gamma.append('0')
+def count_ones(nums : 'numpy.ndarray', width : int) -> List[int]:
+	''' Count the 1 bits in every column of the given numbers, most significant first: a vectorized popcount of
+		each column's mask over all the numbers. '''
+	import numpy as np
+
+	return [int(np.count_nonzero(nums & np.uint64(1 << shift))) for shift in reversed(range(width))]
+
+def get_rates(ones : List[int], total : int) -> Tuple[int, int]:
+	''' The gamma and epsilon rates from the 1 bits counted in every column of total numbers. An epsilon is just a
+		gamma, but inverted. '''
+	gamma = 0
+	for column_ones in ones:
+		gamma = 2 * gamma + most_common_bit(column_ones, total)
+	return gamma, gamma ^ ((1 << len(ones)) - 1)
+
+def get_rating(sorted_nums : 'numpy.ndarray', width : int, most_common : bool) -> int:
+	''' Keep the numbers with the most (or least) common bit in the next column until only one is left. The numbers
+		left are those starting with the prefix chosen so far, a range of the sorted numbers split in two by the first
+		one with a 1 in the next column, so every column takes a binary search instead of a filtering pass. '''
+	import numpy as np
+
+	lo, hi, prefix = 0, len(sorted_nums), 0
+	for shift in reversed(range(width)):
+		if hi - lo == 1:
+			break
+
+		mid = lo + int(np.searchsorted(sorted_nums[lo:hi], np.uint64(prefix | (1 << shift))))
+		zeros, ones = mid - lo, hi - mid
+		## once one side is empty, there is nothing left to choose
+		if zeros == 0 or ones == 0:
+			bit = 1 if ones else 0
 		else:
-			gamma.append('1')
-		
-	return gamma
+			bit = most_common_bit(ones, zeros + ones)
+			if not most_common:
+				bit ^= 1
 
-def get_epsilon(binary_nums : List[str]) -> List[str]:
-	''' An epsilon is just a gamma, but inverted. '''
-	return list(map(invert, get_gamma(binary_nums)))
+		if bit:
+			lo, prefix = mid, prefix | (1 << shift)
+		else:
+			hi = mid
 
-def make_decimal_of(binary_digits : List[str]) -> int:
-	''' Convert a list of binary digits to its decimal representation. '''
-	return int(''.join(binary_digits), 2)
+	return int(sorted_nums[lo])
 
-def part1(binary_nums : List[str]) -> int:
+def part1(nums : 'numpy.ndarray', width : int) -> int:
 	''' Solve part 1. '''
-	gamma = make_decimal_of(get_gamma(binary_nums))
-	epsilon = make_decimal_of(get_epsilon(binary_nums))
+	gamma, epsilon = get_rates(count_ones(nums, width), len(nums))
 	return gamma * epsilon
 
-def part2(binary_nums : List[str]) -> int:
+def part2(nums : 'numpy.ndarray', width : int) -> int:
 	''' Solve part 2. '''
-	bit_length = len(binary_nums[0])
-	binary_nums_oxygen = binary_nums[:]
-	binary_nums_co2 = binary_nums[:]
-
-	oxygen_bit_index = co2_bit_index = 0
-
-	while len(binary_nums_oxygen) > 1:
-		gamma = get_gamma(binary_nums_oxygen)
-		binary_nums_oxygen = list(filter(lambda num: num[oxygen_bit_index] == gamma[oxygen_bit_index], binary_nums_oxygen))
-		oxygen_bit_index = (oxygen_bit_index + 1) % bit_length
-	
-	while len(binary_nums_co2) > 1:
-		epsilon = get_epsilon(binary_nums_co2)
-		binary_nums_co2 = list(filter(lambda num: num[co2_bit_index] == epsilon[co2_bit_index], binary_nums_co2))
-		co2_bit_index = (co2_bit_index + 1) % bit_length
-
-	gen_rating = make_decimal_of(binary_nums_oxygen.pop())
-	scrubber_rating = make_decimal_of(binary_nums_co2.pop())
+	sorted_nums = nums.copy()
+	sorted_nums.sort()
+	gen_rating = get_rating(sorted_nums, width, True)
+	scrubber_rating = get_rating(sorted_nums, width, False)
 	return gen_rating * scrubber_rating
 
-with open('input/day03.txt') as f:
-	lines = [line.rstrip('\n') for line in f.readlines()]
-	print(part1(lines))
-	print(part2(lines))
\ No newline at end of file
+def solve_both(nums : 'numpy.ndarray', width : int) -> Tuple[int, int]:
+	''' Solve both parts, sorting the numbers only once for both ratings. '''
+	gamma, epsilon = get_rates(count_ones(nums, width), len(nums))
+	sorted_nums = nums.copy()
+	sorted_nums.sort()
+	return gamma * epsilon, get_rating(sorted_nums, width, True) * get_rating(sorted_nums, width, False)
+
+def follow_prefixes(prefix_counts : Counter, bit_length : int, most_common : bool) -> int:
+	''' The rating of get_rating, found from how many numbers start with every prefix rather than the numbers: the
+		numbers left after filtering on a column are exactly those starting with the prefix chosen so far. '''
+	node = 1
+	for _ in range(bit_length):
+		zeros, ones = prefix_counts[2 * node], prefix_counts[2 * node + 1]
+		## once one side is empty (say only one number is left), there is nothing left to choose
+		if zeros == 0 or ones == 0:
+			bit = 1 if ones else 0
+		else:
+			bit = most_common_bit(ones, zeros + ones)
+			if not most_common:
+				bit ^= 1
+		node = 2 * node + bit
+
+	return node - (1 << bit_length)
+
+def stream(lines : Iterable[str]) -> Tuple[int, int]:
+	''' Solve both parts from a stream of lines. Instead of the numbers, this keeps how many of them have a 1 in every
+		column and how many start with every prefix, counted only for the prefixes that occur: no more than n * b
+		counters for n b-bit numbers, and never more than 2^(b + 1). '''
+	total, ones, prefix_counts = 0, [], Counter()
+	for line in lines:
+		num = line.strip()
+		if not num:
+			continue
+		if not total:
+			ones = [0] * len(num)
+
+		## the prefix p of k bits is counted at key (1 << k) | p, like the nodes of a binary heap
+		total += 1
+		node = 1
+		for i, bit in enumerate(num):
+			if bit == '1':
+				ones[i] += 1
+				node = 2 * node + 1
+			else:
+				node = 2 * node
+			prefix_counts[node] += 1
+
+	gamma, epsilon = get_rates(ones, total)
+	gen_rating = follow_prefixes(prefix_counts, len(ones), True)
+	scrubber_rating = follow_prefixes(prefix_counts, len(ones), False)
+	return gamma * epsilon, gen_rating * scrubber_rating
+
+def parse(f : TextIO) -> Tuple['numpy.ndarray', int]:
+	''' Parse the puzzle input into the arguments taken by each part: the report's numbers, parsed once into an
+		array of unsigned 64-bit integers, and their width in bits. NumPy is imported lazily, here and in the solvers. '''
+	import numpy as np
+
+	rows = f.read().split()
+	width = len(rows[0])
+	if width > 64:
+		raise ValueError(f'numbers of {width} bits do not fit in 64-bit integers')
+	return np.fromiter(map(int, rows, repeat(2)), dtype=np.uint64, count=len(rows)), width
+
+if __name__ == '__main__':
+	with open('input/day03.txt') as f:
+		args = parse(f)
+	print(part1(*args))
+	print(part2(*args))
\ No newline at end of file
@@ -1,77 +1,121 @@
-from typing import List, Optional
-
-def has_won(board_marked : List[List[bool]], r=5, c=5) -> bool:
-    ''' Has the given board (according to its markings) won? '''
-    for row in range(r):
-        if all(board_marked[row][col] for col in range(c)):
-            return True
-
-    for col in range(c):
-        if all(board_marked[row][col] for row in range(r)):
-            return True
-
-    return False
-
-def process_move(move : str, board : List[List[str]], board_markings : List[List[bool]], r=5, c=5) -> Optional[int]:
-    ''' Updates a board's state after a move, returns the score if this board wins after the move. '''
-    for row in range(r):
-        for col in range(c):
-            if board[row][col] == move:
-                board_markings[row][col] = True
-    
-    if has_won(board_markings):
-        unmarked_sum = 0
-
-        for row in range(r):
-            for col in range(c):
-                if not board_markings[row][col]:
-                    unmarked_sum += int(board[row][col])
-        
-        return unmarked_sum * int(move)
-
-    return None
-
-def part1(moves : List[str], boards : List[List[List[str]]], r=5, c=5) -> Optional[int]:
-    ''' Solve part 1 '''
-    board_markings = [[[False] * c for _ in range(r)] for _ in boards]
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Tuple, TextIO
+
+from parsing import ints
+
+## Numbers below this (or below how many numbers there are) are ranked without renumbering them
+DENSE_TABLE_SIZE = 1 << 16
+
+def build_index(cells : List[int]) -> Dict[int, List[int]]:
+    ''' Index the cells of all boards by their number, in board order. '''
+    index = defaultdict(list)
+    for i, number in enumerate(cells):
+        index[number].append(i)
+
+    return index
+
+def winning_scores(moves : List[int], cells : List[int], r=5, c=5) -> Iterator[int]:
+    ''' Play bingo, yielding the score of every board as it wins (in board order for boards winning on the same
+        move). Every board keeps how many cells of each row and column are marked and the sum of its unmarked cells,
+        so a move only touches the cells holding its number. '''
+    boards = len(cells) // (r * c)
+    index = build_index(cells)
+    row_hits = [[0] * r for _ in range(boards)]
+    col_hits = [[0] * c for _ in range(boards)]
+    unmarked_sums = [sum(cells[i:i + r * c]) for i in range(0, len(cells), r * c)]
+    won = [False] * boards
+    drawn = set()
 
     for move in moves:
-        for board_num, board in enumerate(boards):
-            result = process_move(move, board, board_markings[board_num])
-            if result is not None:
-                return result
+        ## drawing a number again marks nothing new
+        if move in drawn:
+            continue
+        drawn.add(move)
+
+        ## a board can hold the number more than once, so it only wins once all of them are marked
+        winners = dict()
+        for i in index.get(move, ()):
+            board_num, cell = divmod(i, r * c)
+            if won[board_num]:
+                continue
+
+            row, col = divmod(cell, c)
+            unmarked_sums[board_num] -= move
+            row_hits[board_num][row] += 1
+            col_hits[board_num][col] += 1
+            if row_hits[board_num][row] == c or col_hits[board_num][col] == r:
+                winners[board_num] = True
+
+        for board_num in winners:
+            won[board_num] = True
+            yield unmarked_sums[board_num] * move
+
+def ranked_scores(moves : List[int], cells : List[int], r=5, c=5) -> Tuple[Optional[int], Optional[int]]:
+    ''' The scores of the first and last boards to win, without playing: every cell is ranked by the move its number
+        is drawn on, a line is complete on the move of its highest rank, and a board wins on the move its first line
+        completes. Only the two winners are scored, their unmarked cells being those ranked after that move. This is
+        vectorized over all boards at once with NumPy, which is only imported here. '''
+    import numpy as np
 
-def part2(moves : List[str], boards : List[List[List[str]]], r=5, c=5) -> int:
+    board_cells = np.array(cells, dtype=np.int64).reshape(-1, r, c)
+    never = len(moves)
+
+    ## ranking is a table lookup, with numbers ranked by their first draw and undrawn ones after every move. Bingo
+    ## numbers are small and non-negative so they index the table directly, other numbers (moves before cells) are
+    ## renumbered densely first, which takes a sort
+    numbering = np.concatenate((np.array(moves, dtype=np.int64), board_cells.ravel()))
+    if len(numbering) and (numbering.min() < 0 or numbering.max() >= max(len(numbering), DENSE_TABLE_SIZE)):
+        _values, numbering = np.unique(numbering, return_inverse=True)
+    rank_of = np.full(numbering.max(initial=-1) + 1, never)
+    np.minimum.at(rank_of, numbering[:never], np.arange(never))
+    ranks = rank_of[numbering[never:]].reshape(board_cells.shape)
+
+    win_turns = np.minimum(ranks.max(axis=2).min(axis=1), ranks.max(axis=1).min(axis=1))
+    winners = np.flatnonzero(win_turns < never)
+    if not len(winners):
+        return None, None
+
+    def score(board_num : int) -> int:
+        ''' Score of a board on the move it wins. '''
+        turn = win_turns[board_num]
+        return int(board_cells[board_num][ranks[board_num] > turn].sum()) * moves[turn]
+
+    ## the first winner is the first board in order to win on the earliest move, the last the last one on the latest
+    first = winners[np.argmin(win_turns[winners])]
+    last = winners[len(winners) - 1 - np.argmax(win_turns[winners][::-1])]
+    return score(first), score(last)
+
+def part1(moves : List[int], cells : List[int], r=5, c=5, engine='index') -> Optional[int]:
+    ''' Solve part 1 '''
+    if engine == 'ranks':
+        return ranked_scores(moves, cells, r, c)[0]
+    return next(winning_scores(moves, cells, r, c), None)
+
+def part2(moves : List[int], cells : List[int], r=5, c=5, engine='index') -> Optional[int]:
     ''' Solve part 2 '''
-    board_markings = [[[False] * c for _ in range(r)] for _ in boards]
-    scores = []
+    if engine == 'ranks':
+        return ranked_scores(moves, cells, r, c)[1]
+    scores = list(winning_scores(moves, cells, r, c))
+    return scores[-1] if scores else None
 
-    for move in moves:
-        boards_not_won = []
-        board_markings_not_won = []
-
-        for board_num, board in enumerate(boards):
-            result = process_move(move, board, board_markings[board_num])
-            if result is not None:
-                scores.append(result)
-            else:
-                boards_not_won.append(board)
-                board_markings_not_won.append(board_markings[board_num])
-
-        boards, board_markings = boards_not_won, board_markings_not_won
-
-    return scores[-1]
-
-with open('input/day04.txt') as f:
-    lines = [line.rstrip('\n') for line in f.readlines() if line != '\n']
-    moves = lines[0].split(',')
-
-    boards = []
-    for i in range(1, len(lines), 5):
-        board_here = []
-        for j in range(i, i + 5):
-            board_here.append(lines[j].split())
-        boards.append(board_here)
-    
-    print(part1(moves, boards))
-    print(part2(moves, boards))
\ No newline at end of file
+def solve_both(moves : List[int], cells : List[int], r=5, c=5, engine='index') -> Tuple[Optional[int], Optional[int]]:
+    ''' Solve both parts in a single game: the first and last boards to win (None for both if no board wins). With
+        engine='ranks', the game isn't played at all, see ranked_scores, which is faster for many thousands of boards. '''
+    if engine == 'ranks':
+        return ranked_scores(moves, cells, r, c)
+    scores = list(winning_scores(moves, cells, r, c))
+    if not scores:
+        return None, None
+    return scores[0], scores[-1]
+
+def parse(f : TextIO) -> Tuple[List[int], List[int]]:
+    ''' Parse the puzzle input into the arguments taken by each part: the moves, and the cells of all boards
+        in one flat list, board after board and row after row. '''
+    moves, boards_text = f.read().split('\n', 1)
+    return (ints(moves), ints(boards_text))
+
+if __name__ == '__main__':
+    with open('input/day04.txt') as f:
+        args = parse(f)
+    print(part1(*args))
+    print(part2(*args))
\ No newline at end of file
@@ -1,54 +1,249 @@
-from typing import List, Tuple
-
-def parse_vents(vents : List[str]) -> List[Tuple[int, int, int, int]]:
-    ''' Return vents as four element tuples. '''
-    coordinates = []
-
-    for vent in vents:
-        vent = vent.replace(' -> ', ',')
-        coordinates.append(tuple(map(int, vent.split(','))))
-    
-    return coordinates
-
-def vent_sum(vents : List[str], count_diagonals=False) -> int:
-    ''' Returns the number of points where at least two vents overlap. '''
-    coordinates = parse_vents(vents)
-    
-    max_x = max_y = 0
-    for x1, y1, x2, y2 in coordinates:
-        max_x = max(max_x, x1, x2)
-        max_y = max(max_y, y1, y2)
-
-    field = [[0] * (max_x + 1) for _ in range(max_y + 1)]
-
-    for x1, y1, x2, y2 in coordinates:
-        if x1 == x2:
-            if y2 < y1:
-                y1, y2 = y2, y1
-            for i in range(y1, y2 + 1):
-                field[i][x1] += 1
-        elif y1 == y2:
-            if x2 < x1:
-                x1, x2 = x2, x1
-            for j in range(x1, x2 + 1):
-                field[y1][j] += 1
-        elif count_diagonals and abs(x1 - x2) == abs(y1 - y2):
-            xs = list(range(x1, x2 - 1, -1) if x2 < x1 else range(x1, x2 + 1))
-            ys = list(range(y1, y2 - 1, -1) if y2 < y1 else range(y1, y2 + 1))
-            for y, x in zip(ys, xs):
-                field[y][x] += 1
-
-    return sum(sum(col >= 2 for col in row) for row in field)
-
-def part1(vents : List[str]) -> int:
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from math import inf
+from typing import Iterable, Iterator, List, Optional, Set, Tuple, TextIO, TYPE_CHECKING
+
+from parsing import int_records, ints
+
+if TYPE_CHECKING:
+    import numpy
+
+Vent = Tuple[int, int, int, int]
+Line = Tuple[Tuple[int, int], int, int, int]
+
+## Every vent lies on a line a x + b y = key, in one of four directions (a, b)
+HORIZONTAL, VERTICAL, RISING, FALLING = (0, 1), (1, 0), (1, -1), (1, 1)
+DIRECTIONS = (HORIZONTAL, VERTICAL, RISING, FALLING)
+
+## Counting on a dense array is faster than sorting while the bounding box holds no more than this many cells per
+## point covered, and a sparse count is used beyond
+DENSE_CELLS_PER_POINT = 8
+
+def vent_points(vent : Vent, diagonals : bool) -> Iterator[Tuple[int, int]]:
+    ''' Generate the (x, y) points covered by a vent, if it is horizontal or vertical (or diagonal, if asked for). '''
+    x1, y1, x2, y2 = vent
+    if diagonals:
+        if x1 != x2 and y1 != y2 and abs(x1 - x2) == abs(y1 - y2):
+            xs = range(x1, x2 - 1, -1) if x2 < x1 else range(x1, x2 + 1)
+            ys = range(y1, y2 - 1, -1) if y2 < y1 else range(y1, y2 + 1)
+            yield from zip(xs, ys)
+    elif x1 == x2:
+        if y2 < y1:
+            y1, y2 = y2, y1
+        for i in range(y1, y2 + 1):
+            yield x1, i
+    elif y1 == y2:
+        if x2 < x1:
+            x1, x2 = x2, x1
+        for j in range(x1, x2 + 1):
+            yield j, y1
+
+def rasterize(vents : List[Vent], diagonals : bool) -> Tuple['numpy.ndarray', 'numpy.ndarray']:
+    ''' The x and y coordinates of all points covered by the horizontal and vertical vents (or the diagonal ones, if
+        asked for), as arrays with a point for every vent covering it. All points are computed at once: every vent is
+        repeated once per point it covers, then stepped from its start by its point's offset along it. '''
+    import numpy as np
+
+    x1, y1, x2, y2 = np.array(vents, dtype=np.int64).reshape(-1, 4).T
+    if diagonals:
+        chosen = (x1 != x2) & (y1 != y2) & (np.abs(x2 - x1) == np.abs(y2 - y1))
+    else:
+        chosen = (x1 == x2) | (y1 == y2)
+    x1, y1, x2, y2 = x1[chosen], y1[chosen], x2[chosen], y2[chosen]
+
+    lengths = np.maximum(np.abs(x2 - x1), np.abs(y2 - y1)) + 1
+    starts = np.cumsum(lengths) - lengths
+    offsets = np.arange(lengths.sum()) - np.repeat(starts, lengths)
+    xs = np.repeat(x1, lengths) + offsets * np.repeat(np.sign(x2 - x1), lengths)
+    ys = np.repeat(y1, lengths) + offsets * np.repeat(np.sign(y2 - y1), lengths)
+    return xs, ys
+
+def count_overlaps(xs : 'numpy.ndarray', ys : 'numpy.ndarray') -> int:
+    ''' Returns the number of points covered at least twice, counting points by their flat index in the bounding
+        box: with bincount on a dense array if the box is small enough for the number of points, else by sorting
+        them with unique, so huge coordinates cost no more than the points actually covered. '''
+    import numpy as np
+
+    if not len(xs):
+        return 0
+
+    min_x, min_y = int(xs.min()), int(ys.min())
+    width, height = int(xs.max()) - min_x + 1, int(ys.max()) - min_y + 1
+    flat = (ys - min_y) * width + (xs - min_x)
+    if width * height <= DENSE_CELLS_PER_POINT * len(flat):
+        counts = np.bincount(flat, minlength=width * height)
+    else:
+        _points, counts = np.unique(flat, return_counts=True)
+
+    return int(np.count_nonzero(counts >= 2))
+
+def vent_line(vent : Vent, diagonals : bool) -> Optional[Line]:
+    ''' The line a horizontal or vertical vent (or diagonal one, if asked for) lies on, as its direction and key,
+        followed by the range of parameters of the points it covers: their y for vertical vents, else their x. '''
+    x1, y1, x2, y2 = vent
+    if x1 == x2:
+        return VERTICAL, x1, min(y1, y2), max(y1, y2)
+    if y1 == y2:
+        return HORIZONTAL, y1, min(x1, x2), max(x1, x2)
+    if diagonals and abs(x1 - x2) == abs(y1 - y2):
+        direction = RISING if (x2 - x1) * (y2 - y1) > 0 else FALLING
+        return direction, direction[0] * x1 + direction[1] * y1, min(x1, x2), max(x1, x2)
+    return None
+
+def line_point(direction : Tuple[int, int], key : int, t : int) -> Tuple[int, int]:
+    ''' The point of parameter t on a line. '''
+    if direction == VERTICAL:
+        return key, t
+    if direction == HORIZONTAL:
+        return t, key
+    return t, (key - t) if direction == FALLING else (t - key)
+
+def merge_cover(ranges : List[Tuple[int, int]]) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+    ''' Sweep over the ranges of the vents on one line, returning the disjoint ranges of points covered at least
+        once and those covered at least twice, in order. '''
+    ## a range ends just past its last point, and ends come before starts at the same point
+    events = sorted([(lo, 1) for lo, _hi in ranges] + [(hi + 1, -1) for _lo, hi in ranges])
+    once, twice = [], []
+    depth = once_start = twice_start = 0
+    for position, change in events:
+        if change > 0:
+            depth += 1
+            if depth == 1:
+                once_start = position
+            elif depth == 2:
+                twice_start = position
+        else:
+            if depth == 1:
+                once.append((once_start, position - 1))
+            elif depth == 2:
+                twice.append((twice_start, position - 1))
+            depth -= 1
+
+    return once, twice
+
+def crossings(pieces : List[Line]) -> Set[Tuple[int, int]]:
+    ''' The points where pieces of lines in different directions cross. Pieces are indexed in a grid of square
+        buckets, sized so that a piece takes a few buckets on average, and only pieces sharing a bucket are crossed. '''
+    if not pieces:
+        return set()
+
+    size = max(1, sum(hi - lo + 1 for _direction, _key, lo, hi in pieces) // len(pieces))
+    buckets = defaultdict(list)
+    for piece in pieces:
+        direction, key, lo, hi = piece
+        for column in range(lo // size, hi // size + 1):
+            ## the points of the piece whose parameter falls in this column of buckets
+            (x1, y1), (x2, y2) = line_point(direction, key, max(lo, column * size)), line_point(direction, key, min(hi, column * size + size - 1))
+            for bx in range(min(x1, x2) // size, max(x1, x2) // size + 1):
+                for by in range(min(y1, y2) // size, max(y1, y2) // size + 1):
+                    buckets[bx, by].append(piece)
+
+    points = set()
+    for bucket in buckets.values():
+        for i, (direction1, key1, lo1, hi1) in enumerate(bucket):
+            for direction2, key2, lo2, hi2 in bucket[i + 1:]:
+                if direction1 == direction2:
+                    continue
+
+                ## solve a1 x + b1 y = key1 and a2 x + b2 y = key2, the lines only sharing a point with integer coordinates
+                (a1, b1), (a2, b2) = direction1, direction2
+                det = a1 * b2 - a2 * b1
+                x, x_rest = divmod(key1 * b2 - key2 * b1, det)
+                y, y_rest = divmod(a1 * key2 - a2 * key1, det)
+                if x_rest or y_rest:
+                    continue
+
+                t1, t2 = (y if direction1 == VERTICAL else x), (y if direction2 == VERTICAL else x)
+                if lo1 <= t1 <= hi1 and lo2 <= t2 <= hi2:
+                    points.add((x, y))
+
+    return points
+
+def analytic_vent_sum(coordinates : List[Vent], count_diagonals=False) -> int:
+    ''' vent_sum without drawing a single point, so it takes as long however long the vents are. Vents on the same
+        line overlap where a sweep over their ranges finds them covering a point twice. Otherwise, a point covered
+        twice lies on lines in two different directions, where pieces of the lines' covered ranges cross. Those
+        points are counted unless they were already counted on one of their lines (or more, then once in all). '''
+    lines = defaultdict(list)
+    for vent in coordinates:
+        line = vent_line(vent, count_diagonals)
+        if line is not None:
+            direction, key, lo, hi = line
+            lines[direction, key].append((lo, hi))
+
+    pieces, overlaps, total = [], dict(), 0
+    for (direction, key), ranges in lines.items():
+        once, twice = merge_cover(ranges)
+        pieces.extend((direction, key, lo, hi) for lo, hi in once)
+        if twice:
+            overlaps[direction, key] = twice
+            total += sum(hi - lo + 1 for lo, hi in twice)
+
+    for x, y in crossings(pieces):
+        counted = 0
+        for direction in DIRECTIONS:
+            twice = overlaps.get((direction, direction[0] * x + direction[1] * y), ())
+            t = y if direction == VERTICAL else x
+            i = bisect_right(twice, (t, inf)) - 1
+            counted += i >= 0 and twice[i][1] >= t
+        total += 1 - counted
+
+    return total
+
+def vent_sum(coordinates : List[Vent], count_diagonals=False, engine='raster') -> int:
+    ''' Returns the number of points where at least two vents overlap, by rasterizing the vents or, with
+        engine='analytic', from the lines they lie on (see analytic_vent_sum). '''
+    if engine == 'analytic':
+        return analytic_vent_sum(coordinates, count_diagonals)
+
+    import numpy as np
+
+    xs, ys = rasterize(coordinates, diagonals=False)
+    if count_diagonals:
+        diagonal_xs, diagonal_ys = rasterize(coordinates, diagonals=True)
+        xs, ys = np.concatenate((xs, diagonal_xs)), np.concatenate((ys, diagonal_ys))
+
+    return count_overlaps(xs, ys)
+
+def part1(vents : List[Vent], engine='raster') -> int:
     ''' Solve part 1 '''
-    return vent_sum(vents)
+    return vent_sum(vents, engine=engine)
 
-def part2(vents : List[str]) -> int:
+def part2(vents : List[Vent], engine='raster') -> int:
     ''' Solve part 2 '''
-    return vent_sum(vents, count_diagonals=True)
+    return vent_sum(vents, count_diagonals=True, engine=engine)
+
+def solve_both(vents : List[Vent], engine='raster') -> Tuple[int, int]:
+    ''' Solve both parts, rasterizing the horizontal and vertical vents only once. '''
+    if engine == 'analytic':
+        return analytic_vent_sum(vents), analytic_vent_sum(vents, count_diagonals=True)
+
+    import numpy as np
+
+    xs, ys = rasterize(vents, diagonals=False)
+    diagonal_xs, diagonal_ys = rasterize(vents, diagonals=True)
+    return count_overlaps(xs, ys), count_overlaps(np.concatenate((xs, diagonal_xs)), np.concatenate((ys, diagonal_ys)))
+
+def stream(lines : Iterable[str]) -> Tuple[int, int]:
+    ''' Solve both parts from a stream of lines, drawing every vent as soon as it is read. Memory grows with the
+        number of points the vents cover (a counter per point for each part), but not with how many vents there are
+        nor how far apart they lie. '''
+    straight, everything = Counter(), Counter()
+    for line in lines:
+        vent = ints(line)
+        if vent:
+            straight.update(vent_points(vent, diagonals=False))
+            everything.update(vent_points(vent, diagonals=False))
+            everything.update(vent_points(vent, diagonals=True))
+
+    return sum(count >= 2 for count in straight.values()), sum(count >= 2 for count in everything.values())
+
+def parse(f : TextIO) -> Tuple[List[Vent]]:
+    ''' Parse the puzzle input into the arguments taken by each part. '''
+    return (int_records(f.read(), 4),)
 
-with open('input/day05.txt') as f:
-    lines = [line.rstrip('\n') for line in f.readlines() if line != '\n']
-    print(part1(lines))
-    print(part2(lines))
\ No newline at end of file
+if __name__ == '__main__':
+    with open('input/day05.txt') as f:
+        args = parse(f)
+    print(part1(*args))
+    print(part2(*args))
\ No newline at end of file
@@ -1,34 +1,93 @@
 from collections import Counter
-from typing import List
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple, TextIO
 
-def part1(timers : List[int], days=80) -> int:
-    ''' Solve part 1 '''
-    fish_at_time = Counter(timers)
+from parsing import ints
+
+## Timers run from 0 to 8, a fish's timer resetting to 6 when it gives birth to a fish with a timer of 8
+TIMERS, RESET, NEWBORN = 9, 6, 8
+
+Matrix = Tuple[Tuple[int, ...], ...]
+
+IDENTITY : Matrix = tuple(tuple(int(i == j) for j in range(TIMERS)) for i in range(TIMERS))
+
+def transition() -> Matrix:
+    ''' The matrix taking the counts of fish by timer on one day to those of the next: entry [new][old] is how many
+        fish with timer new a fish with timer old turns into. '''
+    matrix = [[0] * TIMERS for _ in range(TIMERS)]
+    for old in range(1, TIMERS):
+        matrix[old - 1][old] = 1
+    matrix[RESET][0] = matrix[NEWBORN][0] = 1
+    return tuple(map(tuple, matrix))
+
+def multiply(a : Matrix, b : Matrix, modulus : Optional[int] = None) -> Matrix:
+    ''' Product of two matrices, reduced modulo the modulus if there is one. '''
+    columns = list(zip(*b))
+    product = tuple(tuple(sum(x * y for x, y in zip(row, column)) for column in columns) for row in a)
+    if modulus is not None:
+        product = tuple(tuple(entry % modulus for entry in row) for row in product)
+    return product
 
-    for _ in range(days):
-        new_fish_at_time = Counter()
-        
-        for timer_val in fish_at_time:
-            if timer_val == 0:
-                new_fish_at_time[8] += fish_at_time[timer_val]
-                new_fish_at_time[6] += fish_at_time[timer_val]
-            else: # timer_val > 0
-                new_fish_at_time[timer_val - 1] += fish_at_time[timer_val]
+@lru_cache(maxsize=64)
+def transition_power(k : int, modulus : Optional[int] = None) -> Matrix:
+    ''' The transition matrix to the power 2^k, squaring the previous power, so every power is only computed once
+        for all queries. Exact entries grow by about a tenth a day, so horizons beyond millions of days need a
+        modulus. '''
+    if k == 0:
+        return multiply(transition(), IDENTITY, modulus)
+    half = transition_power(k - 1, modulus)
+    return multiply(half, half, modulus)
 
-        fish_at_time = new_fish_at_time
+def descendants(days : int, modulus : Optional[int] = None) -> Tuple[int, ...]:
+    ''' How many fish a single fish with every timer value turns into after the given number of days: the column
+        sums of the transition matrix to the power days, multiplying a row of ones by the powers of two making up
+        days, so it takes O(log days) products of a vector with a matrix. '''
+    weights = (1,) * TIMERS
+    for k in range(days.bit_length()):
+        if days >> k & 1:
+            weights = multiply((weights,), transition_power(k, modulus), modulus)[0]
+    return weights
 
-    return sum(fish_at_time.values())
+def timer_counts(timers : List[int]) -> List[int]:
+    ''' Count the fish with every timer value. '''
+    counts = Counter(timers)
+    return [counts[timer] for timer in range(TIMERS)]
+
+def fish_counts(populations : Sequence[List[int]], horizons : Sequence[int], modulus : Optional[int] = None) -> List[List[int]]:
+    ''' Count the fish every starting population (a list of timers) grows into after every number of days (modulo
+        the modulus, if there is one), as one row per population. Each horizon's descendants are found once for all
+        populations, from the same cached powers of the transition matrix. '''
+    weights = [descendants(days, modulus) for days in horizons]
+    counts = []
+    for timers in populations:
+        population = timer_counts(timers)
+        row = [sum(weight * count for weight, count in zip(horizon_weights, population)) for horizon_weights in weights]
+        counts.append(row if modulus is None else [count % modulus for count in row])
+
+    return counts
+
+def part1(timers : List[int], days=80) -> int:
+    ''' Solve part 1 '''
+    return fish_counts([timers], [days])[0][0]
 
 def part2(timers : List[int]) -> int:
     ''' Solve part 2 '''
     return part1(timers, days=256)
 
-with open('input/day06.txt') as f:
-    lines = f.readlines()[0].rstrip('\n')
-    nums = list(map(int, lines.split(',')))
-    print(part1(nums))
-    print(part2(nums))
+def solve_both(timers : List[int]) -> Tuple[int, int]:
+    ''' Solve both parts as one batch query, sharing the powers of the transition matrix. '''
+    after_80, after_256 = fish_counts([timers], [80, 256])[0]
+    return after_80, after_256
+
+def parse(f : TextIO) -> Tuple[List[int]]:
+    ''' Parse the puzzle input into the arguments taken by each part. '''
+    return (ints(f.read()),)
 
-example_input = [3, 4, 3, 1, 2]
-assert part1(example_input) == 5934
-assert part2(example_input) == 26984457539
\ No newline at end of file
+if __name__ == '__main__':
+    with open('input/day06.txt') as f:
+        args = parse(f)
+    print(part1(*args))
+    print(part2(*args))
+    example_input = [3, 4, 3, 1, 2]
+    assert part1(example_input) == 5934
+    assert part2(example_input) == 26984457539
\ No newline at end of file
@@ -1,24 +1,91 @@
-from typing import List
+from bisect import bisect_left
+from fractions import Fraction
+from itertools import accumulate
+from math import ceil, comb, floor
+from typing import List, Tuple, TextIO
 
-def summation(x : int) -> int:
-    ''' Closed form formula for summation. '''
-    return (x * (x + 1)) // 2
+from parsing import ints
+
+## Fuel burned moving a crab a distance d, as the coefficients of a polynomial in d (non-negative, so it is convex)
+Cost = Tuple[Fraction, ...]
+LINEAR : Cost = (0, 1)
+TRIANGULAR : Cost = (0, Fraction(1, 2), Fraction(1, 2))
+
+class Crabs:
+    ''' Sorted crab positions with the prefix sums of their powers, from which the fuel to move every crab to any
+        position costs O(1) for a cost of a given degree, instead of O(n). '''
+    def __init__(self, positions : List[int]) -> None:
+        ''' Constructor from the positions of the crabs. '''
+        self.positions = sorted(positions)
+        ## power_sums[m][i] is the sum of the m-th powers of the first i positions, computed up to the degree needed
+        self.power_sums = []
+
+    def prefix_powers(self, m : int) -> List[int]:
+        ''' Prefix sums of the m-th powers of the positions. '''
+        while len(self.power_sums) <= m:
+            power = len(self.power_sums)
+            self.power_sums.append(list(accumulate((x ** power for x in self.positions), initial=0)))
+        return self.power_sums[m]
+
+    def distance_power_sum(self, p : int, j : int) -> int:
+        ''' Sum of |x - p|^j over all crabs x. For the k crabs below p, that's (p - x)^j, for the others (x - p)^j,
+            both expanded with the binomial theorem into sums of powers of their positions. '''
+        n, k = len(self.positions), bisect_left(self.positions, p)
+        total = 0
+        for m in range(j + 1):
+            sums = self.prefix_powers(m)
+            below, above = sums[k], sums[n] - sums[k]
+            total += comb(j, m) * p ** (j - m) * ((-1) ** m * below + (-1) ** (j - m) * above)
+        return total
+
+    def fuel(self, p : int, cost : Cost) -> int:
+        ''' Fuel for every crab to move to position p. '''
+        return int(sum(coefficient * self.distance_power_sum(p, j) for j, coefficient in enumerate(cost) if coefficient))
+
+def cheapest_fuel(crabs : Crabs, cost : Cost) -> int:
+    ''' Fuel for the crabs to align on the cheapest position. The total cost is convex in the position, so the
+        cheapest is a median for the linear cost, within half a step of the mean for the triangular one, and for any
+        other cost found by binary search for where the cost stops falling. '''
+    xs = crabs.positions
+    if cost == LINEAR:
+        candidates = [xs[len(xs) // 2]]
+    elif cost == TRIANGULAR:
+        mean = Fraction(crabs.prefix_powers(1)[-1], len(xs))
+        candidates = range(floor(mean - Fraction(1, 2)), ceil(mean + Fraction(1, 2)) + 1)
+    else:
+        lo, hi = xs[0], xs[-1]
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if crabs.fuel(mid + 1, cost) >= crabs.fuel(mid, cost):
+                hi = mid
+            else:
+                lo = mid + 1
+        candidates = [lo]
+
+    return min(crabs.fuel(p, cost) for p in candidates)
 
 def part1(xs : List[int]) -> int:
     ''' Solve part 1 '''
-    left, right = min(xs), max(xs)
-    return min(sum(abs(x - i) for x in xs) for i in range(left, right + 1))
+    return cheapest_fuel(Crabs(xs), LINEAR)
 
 def part2(xs : List[int]) -> int:
     ''' Solve part 2 '''
-    left, right = min(xs), max(xs)
-    return min(sum(summation(abs(x - i)) for x in xs) for i in range(left, right + 1))
+    return cheapest_fuel(Crabs(xs), TRIANGULAR)
+
+def solve_both(xs : List[int]) -> Tuple[int, int]:
+    ''' Solve both parts, sorting the crabs and summing their positions only once. '''
+    crabs = Crabs(xs)
+    return cheapest_fuel(crabs, LINEAR), cheapest_fuel(crabs, TRIANGULAR)
 
-with open('input/day07.txt') as f:
-    lines = list(map(int, f.readlines()[0].rstrip('\n').split(',')))
-    print(part1(lines))
-    print(part2(lines))
+def parse(f : TextIO) -> Tuple[List[int]]:
+    ''' Parse the puzzle input into the arguments taken by each part. '''
+    return (ints(f.read()),)
 
-example_input = [16,1,2,0,4,2,7,1,2,14]
-assert part1(example_input) == 37
-assert part2(example_input) == 168
\ No newline at end of file
+if __name__ == '__main__':
+    with open('input/day07.txt') as f:
+        args = parse(f)
+    print(part1(*args))
+    print(part2(*args))
+    example_input = [16,1,2,0,4,2,7,1,2,14]
+    assert part1(example_input) == 37
+    assert part2(example_input) == 168
\ No newline at end of file
@@ -1,16 +1,34 @@
-from typing import List, Dict
+from typing import Iterable, List, Dict, Optional, Tuple, TextIO
+
+from parsing import lines
 
 ## Map from number of segments to the decoded digit (as a string)
 UNIQUE_SEGMENTS = {2: '1', 4: '4', 3 : '7', 7 : '8'}
 
-def str_subset(a : str, b : str) -> bool:
-    ''' Is a's character set of a subset of b's? '''
-    return set(a).issubset(set(b))
+## The segments lit for every digit on a correctly wired display, as 7-bit masks (bit i for the i-th letter)
+LETTERS = 'abcdefg'
+DIGIT_SEGMENTS = ('abcefg', 'cf', 'acdeg', 'acdfg', 'bcdf', 'abdfg', 'abdefg', 'acf', 'abcdefg', 'abcdfg')
+DIGIT_MASKS = tuple(sum(1 << LETTERS.index(letter) for letter in segments) for segments in DIGIT_SEGMENTS)
+
+## Digits lighting a number of segments no other digit does
+UNIQUE_DIGITS = {1, 4, 7, 8}
+
+## Added to the counts of signals lighting a segment, so translated into bytes they are never whitespace
+OFFSET = 16
+
+## Entries are decoded by worker processes in chunks of this many
+CHUNK_SIZE = 1 << 14
+
+def signature_table() -> Dict[int, int]:
+    ''' Map from the signature of a digit to the digit. Rewiring only renames segments, so how many of the ten
+        patterns light a segment doesn't depend on the wiring, nor does a digit's signature, the sum of these counts
+        over its segments. They happen to be different for every digit (counts are taken OFFSET higher). '''
+    occurrences = [OFFSET + sum(mask >> i & 1 for mask in DIGIT_MASKS) for i in range(len(LETTERS))]
+    table = dict((sum(occurrences[i] for i in range(len(LETTERS)) if mask >> i & 1), digit) for digit, mask in enumerate(DIGIT_MASKS))
+    assert len(table) == len(DIGIT_MASKS), 'signatures must tell the digits apart'
+    return table
 
-def add_mappings(encode : Dict[str, str], decode : Dict[str, str], cipher : str, plain : str) -> None:
-    ''' Adds mapping from plaintext to ciphertext and vice versa in encoding/decoding caches. '''
-    encode[plain] = cipher
-    decode[cipher] = plain
+DIGIT_OF_SIGNATURE = signature_table()
 
 def part1(entries : List[str]) -> int:
     ''' Solve part 1 '''
@@ -23,58 +41,60 @@ def part1(entries : List[str]) -> int:
 
     return ans
 
-def part2(entries : List[int]) -> int:
-    ''' Solve part 2 '''
-    ans = 0
+def output_signatures(entry : str) -> List[int]:
+    ''' The signatures of an entry's output digits (see signature_table): every letter of the output is translated
+        into how many of the entry's signals light its segment, and each digit's counts summed. '''
+    encoded_signals, encoded_output = entry.split('|')
+    occurrences = bytes.maketrans(LETTERS.encode(), bytes(OFFSET + encoded_signals.count(letter) for letter in LETTERS))
+    return list(map(sum, encoded_output.encode().translate(occurrences).split()))
 
+def decode_totals(entries : Iterable[str]) -> Tuple[int, int]:
+    ''' Decode every entry, counting its decoded 1s, 4s, 7s and 8s and summing its output values. '''
+    unique_digits = output_sum = 0
     for entry in entries:
-        encoded_signals, encoded_output = entry.split('|')
-        encoded_signals = [''.join(sorted(signal)) for signal in encoded_signals.split()]
-        encoded_output = [''.join(sorted(output)) for output in encoded_output.split()]
-        encode, decode = dict(), dict()
-
-        # decode the uniques first
-        for encoded_signal in encoded_signals:
-            if len(encoded_signal) in UNIQUE_SEGMENTS:
-                add_mappings(encode, decode, encoded_signal, UNIQUE_SEGMENTS[len(encoded_signal)])
-
-            # missing: [0, 2, 3, 5, 6, 9]
-
-        # focus on 6 segment digits
-        for encoded_signal in encoded_signals:
-            if len(encoded_signal) == 6:
-                # try to decode '9': it uses exactly 2 more segments than '4'
-                if str_subset(encode['4'], encoded_signal):
-                    add_mappings(encode, decode, encoded_signal, '9')
-                # try to decode '0': it uses exactly 3 more segments than '7'
-                elif str_subset(encode['7'], encoded_signal):
-                    add_mappings(encode, decode, encoded_signal, '0')
-                # '6' does not fulfill the above criterion and is the last candidate
-                else:
-                    add_mappings(encode, decode, encoded_signal, '6')
-
-            # missing: [2, 3, 5]
-
-        # focus on 5 segment digits
-        for encoded_signal in encoded_signals:
-            if len(encoded_signal) == 5:
-                # try to decode '3': it uses exactly 3 more segments than '1'
-                if str_subset(encode['1'], encoded_signal):
-                    add_mappings(encode, decode, encoded_signal, '3')
-                # try to decode '5': it uses exactly 1 less character than '9'
-                elif str_subset(encoded_signal, encode['9']):
-                    add_mappings(encode, decode, encoded_signal, '5')
-                # '2' does not fulfill the above criterion and is the last candidate
-                else:
-                    add_mappings(encode, decode, encoded_signal, '2')
-
-            # we're done!
-
-        ans += int(''.join(decode[digit] for digit in encoded_output))
+        if '|' not in entry:
+            continue
 
-    return ans
+        value = 0
+        for signature in output_signatures(entry):
+            digit = DIGIT_OF_SIGNATURE[signature]
+            unique_digits += digit in UNIQUE_DIGITS
+            value = 10 * value + digit
+        output_sum += value
+
+    return unique_digits, output_sum
+
+def bulk_totals(entries : List[str], jobs : Optional[int] = 1) -> Tuple[int, int]:
+    ''' decode_totals, split into chunks of CHUNK_SIZE entries decoded by a pool of jobs worker processes (one per
+        CPU if jobs is None), unless jobs is 1. '''
+    if jobs == 1:
+        return decode_totals(entries)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunks = [entries[i:i + CHUNK_SIZE] for i in range(0, len(entries), CHUNK_SIZE)]
+    with ProcessPoolExecutor(jobs) as pool:
+        totals = list(pool.map(decode_totals, chunks))
+    return sum(unique_digits for unique_digits, _output_sum in totals), sum(output_sum for _unique_digits, output_sum in totals)
+
+def part2(entries : List[str], jobs : Optional[int] = 1) -> int:
+    ''' Solve part 2 '''
+    return bulk_totals(entries, jobs)[1]
+
+def solve_both(entries : List[str], jobs : Optional[int] = 1) -> Tuple[int, int]:
+    ''' Solve both parts from a single decoding of every entry: part 1 counts its decoded 1s, 4s, 7s and 8s. '''
+    return bulk_totals(entries, jobs)
+
+def stream(lines : Iterable[str]) -> Tuple[int, int]:
+    ''' Solve both parts from a stream of lines: every entry is decoded on its own, so only the sums are kept. '''
+    return decode_totals(lines)
+
+def parse(f : TextIO) -> Tuple[List[str]]:
+    ''' Parse the puzzle input into the arguments taken by each part. '''
+    return (lines(f),)
 
-with open('input/day08.txt') as f:
-    lines = [line.rstrip('\n') for line in f.readlines()]
-    print(part1(lines))
-    print(part2(lines))
\ No newline at end of file
+if __name__ == '__main__':
+    with open('input/day08.txt') as f:
+        args = parse(f)
+    print(part1(*args))
+    print(part2(*args))
\ No newline at end of file
@@ -1,57 +1,75 @@
 from functools import reduce
 from statistics import median
-from typing import List
+from typing import Iterable, List, Optional, Tuple, TextIO
+
+from parsing import lines
 
 PAIRING = {')': '(', '}': '{', ']': '[', '>': '<'}
 PAIRING_INV = dict(kv[::-1] for kv in PAIRING.items())
 SCORE_P1 = {')': 3, ']': 57, '}': 1197, '>': 25137}
 SCORE_P2 = {')': 1, ']': 2, '}': 3, '>': 4}
 
+def scan(chunk : str) -> Tuple[Optional[str], List[str]]:
+    ''' Scan a line with a stack of open brackets, returning the first illegal closing bracket (None if there is
+        none) and the brackets left open. '''
+    stack = []
+    for c in chunk:
+        if c not in PAIRING:
+            stack.append(c)
+        elif not stack or PAIRING[c] != stack[-1]:
+            return c, stack
+        else:
+            stack.pop()
+
+    return None, stack
+
+def completion_score(stack : List[str]) -> int:
+    ''' Score of the brackets closing everything left open on a stack. '''
+    return reduce(lambda total, paren: 5 * total + SCORE_P2[PAIRING_INV[paren]], stack[::-1], 0)
+
 def part1(chunks : List[str]) -> int:
     ''' Solve part 1 '''
     error = 0
     for chunk in chunks:
-        stack = []
-        for c in chunk:
-            if c not in PAIRING:
-                stack.append(c)
-            elif not stack or PAIRING[c] != stack[-1]:
-                error += SCORE_P1[c]
-                break
-            else:
-                stack.pop()
+        illegal, _stack = scan(chunk)
+        if illegal is not None:
+            error += SCORE_P1[illegal]
 
     return error
 
 def part2(chunks : List[str]) -> int:
     ''' Solve part 2 '''
-    incomplete = []
+    completion_scores = []
+    for chunk in chunks:
+        illegal, stack = scan(chunk)
+        if illegal is None:
+            completion_scores.append(completion_score(stack))
 
+    return median(completion_scores)
+
+def solve_both(chunks : Iterable[str]) -> Tuple[int, int]:
+    ''' Solve both parts, scanning every line only once. '''
+    error, completion_scores = 0, []
     for chunk in chunks:
-        malformed = False
-        stack = []
-        for c in chunk:
-            if c not in PAIRING:
-                stack.append(c)
-            elif not stack or PAIRING[c] != stack[-1]:
-                malformed = True
-                break
-            else:
-                stack.pop()
-
-        if not malformed:
-            incomplete.append(stack)
-    
-    completion_scores = []
+        illegal, stack = scan(chunk)
+        if illegal is not None:
+            error += SCORE_P1[illegal]
+        else:
+            completion_scores.append(completion_score(stack))
 
-    for stack in incomplete:
-        completion_scores.append(reduce(
-            lambda total, paren: 5 * total + SCORE_P2[PAIRING_INV[paren]],\
-            stack[::-1], 0))
+    return error, median(completion_scores)
 
-    return median(completion_scores)
+def stream(lines : Iterable[str]) -> Tuple[int, int]:
+    ''' Solve both parts from a stream of lines, keeping a running error score. The median needs every completion
+        score, but those are one number per incomplete line rather than the lines themselves. '''
+    return solve_both(line.rstrip('\n') for line in lines if line.strip())
+
+def parse(f : TextIO) -> Tuple[List[str]]:
+    ''' Parse the puzzle input into the arguments taken by each part. '''
+    return (lines(f),)
 
-with open('input/day10.txt') as f:
-    lines = [line.rstrip('\n') for line in f.readlines()]
-    print(part1(lines))
-    print(part2(lines))
\ No newline at end of file
+if __name__ == '__main__':
+    with open('input/day10.txt') as f:
+        args = parse(f)
+    print(part1(*args))
+    print(part2(*args))
\ No newline at end of file
@@ -1,38 +1,33 @@
-from itertools import product
-from typing import List
 from copy import deepcopy
+from typing import Tuple, TextIO
 
-Grid = List[List[int]]
+from grid import Grid
+from parsing import char_grid
+
+## Adds one to every energy level in a single pass over the cells
+INCREMENT = bytes(range(1, 256)) + bytes([255])
 
 def step(grid : Grid) -> int:
     ''' Simulate energy gain step and report number of flashes achieved. '''
-    m, n = len(grid), len(grid[0])
-
-    for i, j in product(range(m), range(n)):
-        grid[i][j] += 1
-
-    has_flashed = True
-    flashed = set()
-    while has_flashed:
-        has_flashed = False
-        
-        for i, j in product(range(m), range(n)):
-            if grid[i][j] >= 10 and (i, j) not in flashed:
-                has_flashed = True
-                flashed.add((i, j))
-
-                for ni, nj in [ # cardinal directions
-                                (i + 1, j), (i - 1, j), (i, j - 1), (i, j + 1),
-                                # diagonals
-                                (i + 1, j + 1), (i - 1, j - 1), (i + 1, j - 1), (i - 1, j + 1)]:
-                    if 0 <= ni < m and 0 <= nj < n:
-                        grid[ni][nj] += 1
-
-    for i, j in product(range(m), range(n)):
-        if grid[i][j] >= 10:
-            grid[i][j] = 0
-    
-    return len(flashed)
+    cells, neighbors = grid.cells, grid.neighbors(diagonal=True)
+    cells[:] = cells.translate(INCREMENT)
+
+    ## every octopus flashes once, as soon as it reaches 10, then lights up its neighbors
+    to_flash = [i for i, energy in enumerate(cells) if energy >= 10]
+    flashed = 0
+    while to_flash:
+        i = to_flash.pop()
+        flashed += 1
+        for j in neighbors[i]:
+            cells[j] += 1
+            if cells[j] == 10:
+                to_flash.append(j)
+
+    for i, energy in enumerate(cells):
+        if energy >= 10:
+            cells[i] = 0
+
+    return flashed
 
 def part1(grid : Grid) -> int:
     ''' Solve part 1 '''
@@ -41,13 +36,31 @@ def part1(grid : Grid) -> int:
 def part2(grid : Grid) -> int:
     ''' Solve part 2 '''
     step_num = 1
-    while step(grid) != 100:
+    while step(grid) != len(grid):
         step_num += 1
 
     return step_num
 
-with open('input/day11.txt') as f:
-    lines = [line.rstrip('\n') for line in f.readlines()]
-    lines = [list(map(int, list(line))) for line in lines]
-    print(part1(deepcopy(lines)))
-    print(part2(deepcopy(lines)))
\ No newline at end of file
+def solve_both(grid : Grid) -> Tuple[int, int]:
+    ''' Solve both parts in one simulation, which runs until both the first 100 steps and the first synchronized
+        flash are over. '''
+    flashes, synchronized, step_num = 0, None, 0
+    while step_num < 100 or synchronized is None:
+        step_num += 1
+        flashed = step(grid)
+        if step_num <= 100:
+            flashes += flashed
+        if flashed == len(grid) and synchronized is None:
+            synchronized = step_num
+
+    return flashes, synchronized
+
+def parse(f : TextIO) -> Tuple[Grid]:
+    ''' Parse the puzzle input into the arguments taken by each part. '''
+    return (char_grid(f.read()),)
+
+if __name__ == '__main__':
+    with open('input/day11.txt') as f:
+        args = parse(f)
+    print(part1(*deepcopy(args)))
+    print(part2(*deepcopy(args)))
\ No newline at end of file
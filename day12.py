@@ -1,6 +1,9 @@
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Tuple, TextIO
 from collections import defaultdict
 
+from memo import memoize
+from parsing import lines
+
 def build_graph(edges : List[str]) -> Dict[str, Set[str]]:
     ''' Build the graph data structure's vertices and edges, represented as a Dict. '''
     graph = defaultdict(set)
@@ -11,33 +14,38 @@ def build_graph(edges : List[str]) -> Dict[str, Set[str]]:
 
     return graph
 
+def small_cave_bits(graph : Dict[str, Set[str]]) -> Dict[str, int]:
+    ''' Give every small cave its own bit, so the small caves seen so far fit in an int (big caves have none). '''
+    small_caves = [cave for cave in graph if cave != cave.upper()]
+    return dict((cave, 1 << i) for i, cave in enumerate(small_caves))
+
 def part1(edges : List[str]) -> int:
     ''' Solve part 1 '''
     graph = build_graph(edges)
-    seen = {'start'}
+    bits = small_cave_bits(graph)
 
-    def DFS(curr):
+    @memoize()
+    def DFS(curr, seen):
         ''' Count number of paths visiting no small cave more than once. '''
         if curr == 'end':
             return 1
         
         ans = 0
         for nei in graph[curr]:
-            if nei == nei.upper() or nei not in seen:
-                seen.add(nei)
-                ans += DFS(nei)
-                seen.discard(nei)
+            if not bits.get(nei, 0) & seen:
+                ans += DFS(nei, seen | bits.get(nei, 0))
 
         return ans
     
-    return DFS('start')
+    return DFS('start', bits['start'])
 
 def part2(edges : List[str]) -> int:
     ''' Solve part 2 '''
     graph = build_graph(edges)
-    seen = {'start'}
+    bits = small_cave_bits(graph)
 
-    def DFS(curr, seen_twice):
+    @memoize()
+    def DFS(curr, seen, seen_twice):
         ''' Count number of paths visiting no one small cave more than twice,
             and no other small cave more than once. '''
         if curr == 'end':
@@ -45,18 +53,48 @@ def part2(edges : List[str]) -> int:
         
         ans = 0
         for nei in graph[curr]:
-            if nei == nei.upper() or nei not in seen:
-                seen.add(nei)
-                ans += DFS(nei, seen_twice)
-                seen.discard(nei)
+            if not bits.get(nei, 0) & seen:
+                ans += DFS(nei, seen | bits.get(nei, 0), seen_twice)
             elif nei != 'start' and not seen_twice:
-                ans += DFS(nei, True)
+                ans += DFS(nei, seen, True)
         
         return ans
 
-    return DFS('start', False)
+    return DFS('start', bits['start'], False)
+
+def solve_both(edges : List[str]) -> Tuple[int, int]:
+    ''' Solve both parts with part 2's search: part 1's paths are exactly those never visiting a small cave twice. '''
+    graph = build_graph(edges)
+    bits = small_cave_bits(graph)
+
+    @memoize()
+    def DFS(curr, seen, seen_twice):
+        ''' Count number of paths visiting no small cave more than once, and number of paths visiting no one small
+            cave more than twice, and no other small cave more than once. '''
+        if curr == 'end':
+            return (0 if seen_twice else 1), 1
+
+        once = twice = 0
+        for nei in graph[curr]:
+            if not bits.get(nei, 0) & seen:
+                paths_once, paths_twice = DFS(nei, seen | bits.get(nei, 0), seen_twice)
+            elif nei != 'start' and not seen_twice:
+                paths_once, paths_twice = DFS(nei, seen, True)
+            else:
+                continue
+            once += paths_once
+            twice += paths_twice
+
+        return once, twice
+
+    return DFS('start', bits['start'], False)
+
+def parse(f : TextIO) -> Tuple[List[str]]:
+    ''' Parse the puzzle input into the arguments taken by each part. '''
+    return (lines(f),)
 
-with open('input/day12.txt') as f:
-    lines = [line.rstrip('\n') for line in f.readlines()]
-    print(part1(lines))
-    print(part2(lines))
\ No newline at end of file
+if __name__ == '__main__':
+    with open('input/day12.txt') as f:
+        args = parse(f)
+    print(part1(*args))
+    print(part2(*args))
\ No newline at end of file
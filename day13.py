@@ -1,49 +1,52 @@
-from typing import List, Tuple
+from typing import List, Tuple, TextIO
+
+from grid import Grid
+from parsing import blocks, int_records
 
-Grid = List[List[str]]
 Point = Tuple[int, int]
 
-def pretty_print(grid : Grid) -> None:
-    ''' Debug print a grid. '''
-    for row in grid:
-        print(''.join(row))
+def pretty_print(grid : Grid) -> str:
+    ''' Render a grid as printable lines. '''
+    return '\n'.join(grid.to_lines('.#'))
 
-def merge_dots(dot_a : str, dot_b : str) -> str:
-    ''' Return what dot is the result of folding two together. '''
-    if dot_a == '#' or dot_b == '#':
-        return '#'
-    return '.'
+def merge_dots(dots_a : bytes, dots_b : bytes) -> bytes:
+    ''' Return what row of dots is the result of folding two together, ORing all of their dots at once. '''
+    merged = int.from_bytes(dots_a, 'big') | int.from_bytes(dots_b, 'big')
+    return merged.to_bytes(len(dots_a), 'big')
 
 def make_paper_grid(dots : List[Point]) -> Grid:
     ''' Make the starting grid from the given dots. '''
     y_bound = max(y for _x, y in dots)
     x_bound = max(x for x, _y in dots)
 
-    grid = [['.'] * (x_bound + 1) for _ in range(y_bound + 1)]
+    grid = Grid(y_bound + 1, x_bound + 1)
     for x, y in dots:
-        grid[y][x] = '#'
+        grid[y, x] = 1
 
     return grid
 
 def fold_x(grid : Grid, column : int) -> Grid:
     ''' Fold the grid left vertically and return a new grid. '''
-    m, n = len(grid), len(grid[0])
+    ## a fold on or past the last column of dots leaves the grid as it is
+    column = min(column, grid.n)
+    folded = Grid(grid.m, column)
+    width = max(grid.n - column - 1, 0)
+
+    for row, folded_row in zip(grid.rows(), folded.rows()):
+        folded_row[:] = row[:column]
+        folded_row[column - width:] = merge_dots(row[column - width:column], bytes(row[column + 1:])[::-1])
 
-    for fold_column in range(column + 1, n):
-        for fold_row in range(m):
-            grid[fold_row][column - (fold_column - column)] = merge_dots(grid[fold_row][fold_column], grid[fold_row][column - (fold_column - column)])
-    
-    return [row[:column] for row in grid]
+    return folded
 
 def fold_y(grid : Grid, row : int) -> Grid:
     ''' Fold the grid up horizontally and return a new grid. '''
-    m, n = len(grid), len(grid[0])
-    
-    for fold_row in range(row + 1, m):
-        for fold_column in range(n):
-            grid[row - (fold_row - row)][fold_column] = merge_dots(grid[row - (fold_row - row)][fold_column], grid[fold_row][fold_column])
+    row = min(row, grid.m)
+    folded = Grid(row, grid.n, grid.cells[:row * grid.n])
+
+    for fold_row in range(row + 1, grid.m):
+        folded.row(row - (fold_row - row))[:] = merge_dots(folded.row(row - (fold_row - row)), grid.row(fold_row))
 
-    return grid[:row]
+    return folded
 
 def apply_fold(grid : Grid, insn : str) -> Grid:
     ''' Parses a fold instruction and applies it to a grid. '''
@@ -57,27 +60,30 @@ def part1(dots : List[Point], insns : List[str]) -> int:
     ''' Solve part 1 '''
     grid = make_paper_grid(dots)
     grid = apply_fold(grid, insns[0])
-    return sum(sum(dot == '#' for dot in row) for row in grid)
+    return sum(grid.cells)
 
-def part2(dots : List[Point], insns : List[str]) -> None:
+def part2(dots : List[Point], insns : List[str]) -> str:
     ''' Solve part 2 '''
     grid = make_paper_grid(dots)
     for insn in insns:
         grid = apply_fold(grid, insn)
-    pretty_print(grid)
-
-with open('input/day13.txt') as f:
-    lines = [line.rstrip('\n') for line in f.readlines()]
-
-    dots_read = False
-    dots, insns = [], []
-    for line in lines:
-        if line == '':
-            dots_read = True
-        elif not dots_read:
-            dots.append(tuple(map(int, line.split(','))))
-        else:
-            insns.append(line)
-
-    print(part1(dots, insns))
-    part2(dots, insns)
\ No newline at end of file
+    return pretty_print(grid)
+
+def solve_both(dots : List[Point], insns : List[str]) -> Tuple[int, str]:
+    ''' Solve both parts, part 2 carrying on folding from where part 1 stopped. '''
+    grid = apply_fold(make_paper_grid(dots), insns[0])
+    dots_after_one_fold = sum(grid.cells)
+    for insn in insns[1:]:
+        grid = apply_fold(grid, insn)
+    return dots_after_one_fold, pretty_print(grid)
+
+def parse(f : TextIO) -> Tuple[List[Point], List[str]]:
+    ''' Parse the puzzle input into the arguments taken by each part. '''
+    dots, insns = blocks(f.read())
+    return (int_records(dots, 2), insns.splitlines())
+
+if __name__ == '__main__':
+    with open('input/day13.txt') as f:
+        args = parse(f)
+    print(part1(*args))
+    print(part2(*args))
\ No newline at end of file
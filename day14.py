@@ -1,18 +1,15 @@
-from typing import List, Dict, Tuple
+from typing import List, Dict, Sequence, Tuple, TextIO
 from collections import Counter
 from copy import deepcopy
 
+from parsing import blocks, records
+
 StrIntCounter = Dict[str, int]
 PairRules = Dict[str, str]
 
-def build_rules(rules : List[str]) -> PairRules:
+def build_rules(rules : str) -> PairRules:
     ''' Represent polymerization rules as a dictionary mapping pair insertion rules to results. '''
-    rule_dict = dict()
-    for rule in rules:
-        pair, result = rule.split(' -> ')
-        rule_dict[pair] = result
-    
-    return rule_dict
+    return dict(records(rules, r'(\w+) -> (\w+)'))
 
 def step(state : StrIntCounter, element_count : StrIntCounter, rules : PairRules) -> Tuple[StrIntCounter, StrIntCounter]:
     ''' Count number of pairings and elements after one step. '''
@@ -27,28 +24,39 @@ def step(state : StrIntCounter, element_count : StrIntCounter, rules : PairRules
 
     return new_state, new_element_count
 
-def solve(template : str, rules : PairRules, num_steps : int) -> int:
-    ''' Simulate the given number of steps to get the answer. '''
+def solve(template : str, rules : PairRules, checkpoints : Sequence[int]) -> List[int]:
+    ''' Simulate up to the last checkpoint, getting the answer after every checkpoint's number of steps. '''
     state = Counter(template[i:i+2] for i in range(len(template) - 1))
     element_count = Counter(template)
 
-    for _ in range(num_steps):
+    answers = []
+    for num_steps in range(1, max(checkpoints) + 1):
         state, element_count = step(state, element_count, rules)
+        if num_steps in checkpoints:
+            counts = element_count.most_common()
+            answers.append(counts[0][1] - counts[-1][1])
 
-    counts = element_count.most_common()
-    return counts[0][1] - counts[-1][1]
+    return answers
 
 def part1(template : str, rules : PairRules) -> int:
     ''' Solve part 1 '''
-    return solve(template, rules, 10)
+    return solve(template, rules, [10])[0]
     
 def part2(template : str, rules : PairRules) -> int:
     ''' Solve part 2 '''
-    return solve(template, rules, 40)
-
-with open('input/day14.txt') as f:
-    lines = [line.rstrip('\n') for line in f.readlines()]
-    template = lines[0]
-    rules = build_rules(lines[2:])
-    print(part1(template, rules))
-    print(part2(template, rules))
\ No newline at end of file
+    return solve(template, rules, [40])[0]
+
+def solve_both(template : str, rules : PairRules) -> Tuple[int, int]:
+    ''' Solve both parts, part 2 carrying on from where part 1's 10 steps stopped. '''
+    return tuple(solve(template, rules, [10, 40]))
+
+def parse(f : TextIO) -> Tuple[str, PairRules]:
+    ''' Parse the puzzle input into the arguments taken by each part. '''
+    template, rules = blocks(f.read())
+    return (template, build_rules(rules))
+
+if __name__ == '__main__':
+    with open('input/day14.txt') as f:
+        args = parse(f)
+    print(part1(*args))
+    print(part2(*args))
\ No newline at end of file
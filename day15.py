@@ -1,94 +1,67 @@
-from collections import defaultdict
-from itertools import product
-from typing import List, Tuple, Dict, Set
-from heapdict import heapdict
-from copy import deepcopy
+from typing import Tuple, TextIO
 
-Grid = List[List[int]]
-Node = Tuple[int, int]
-Graph = Dict[Node, Set[Node]]
+from grid import Grid
+from parsing import char_grid
+from pqueue import new_queue
 
-def dijkstra(graph : Graph, start : Node, end : Node) -> int:
-    ''' Dijkstra's with a heap - O(n log n + m log n) time '''
-    dists = dict((node, float('inf')) for node in graph)
-    lookups = dict((node, float('inf')) for node in graph)
-    dists[start] = 0
-    lookups[start] = 0
+## Risk levels wrap from 9 back around to 1 every time the cave is repeated
+INCREMENT = bytes.maketrans(bytes(range(1, 10)), bytes(range(2, 10)) + bytes([1]))
 
-    # Let Q be a new heap
-    Q = heapdict()
-    Q[start] = 0
-    for u in graph:
-        if u != start:
-            Q[u] = float('inf')
+def dijkstra(grid : Grid, start : int, end : int, queue : str = 'dial') -> int:
+    ''' Dijkstra's over the flat cell indices. Risk levels are at most 9, so by default the priority queue is a
+        bucket queue - O(n) time, as every cell has at most 4 neighbors '''
+    weights, neighbors = grid.cells, grid.neighbors()
+    dists = [float('inf')] * len(grid)
+    dists[start] = 0
+    done = bytearray(len(grid))
 
-    nodes_in_Q = set()
-    for u in graph:
-        nodes_in_Q.add(u)
+    # Let Q be a new priority queue, cells only enter it once they are reached
+    Q = new_queue(queue, max_weight=9)
+    Q.push(start, 0)
 
     while Q:
         # extract min
-        u, dists[u] = Q.popitem()
-        nodes_in_Q.remove(u)
+        u, dist = Q.pop()
+        if u == end:
+            return dist
+        done[u] = 1
 
-        # consider outneighbors
-        for v in graph[u]:
-            if v in nodes_in_Q:
-                dists[v] = lookups[v]
-                if dists[v] > dists[u] + graph[u][v]:
-                    Q[v] = dists[u] + graph[u][v]
-                    lookups[v] = dists[u] + graph[u][v]
+        # consider outneighbors, entering a cell costs its risk level
+        for v in neighbors[u]:
+            if not done[v] and dists[v] > dist + weights[v]:
+                dists[v] = dist + weights[v]
+                Q.push(v, dists[v])
 
     return dists[end]
 
-def to_graph(grid : Grid) -> Graph:
-    ''' Converts a grid into a weighted graph representation. '''
-    m, n = len(grid), len(grid[0])
-    graph = defaultdict(dict)
-
-    for i, j in product(range(m), range(n)):
-        for nr, nc in [(i + 1, j), (i - 1, j), (i, j + 1), (i, j - 1)]:
-            if 0 <= nr < m and 0 <= nc < n:
-                graph[(i, j)][(nr, nc)] = grid[nr][nc]
-    
-    return graph
-
 def repeat(grid : Grid) -> Grid:
     ''' Copy a grid with all its grid cells incremented. '''
-    m, n = len(grid), len(grid[0])
-    new_grid = deepcopy(grid)
-
-    for i, j in product(range(m), range(n)):
-        new_grid[i][j] = (new_grid[i][j] % 9) + 1
-
-    return new_grid
+    return Grid(grid.m, grid.n, grid.cells.translate(INCREMENT))
 
-def part1(grid : Grid) -> int:
+def part1(grid : Grid, queue : str = 'dial') -> int:
     ''' Solve part 1 '''
-    m, n = len(grid), len(grid[0])
-    return dijkstra(to_graph(grid), (0, 0), (m - 1, n - 1))
-
-def part2(grid : Grid) -> int:
-    ''' Solve part 2, this is super slow (around 15 seconds) '''
-    m = len(grid)
-
-    top_grids = [grid]
-    for _ in range(4):
-        top_grids.append(repeat(top_grids[-1]))
-
-    top_row = top_grids[0]
-    for j in range(m):
-        top_row[j].extend(sum([top_grids[i][j] for i in range(1, 5)], []))
-
-    entire_grid = [top_row]
-    for _ in range(4):
-        entire_grid.append(repeat(entire_grid[-1]))
-
-    entire_grid = sum(entire_grid, [])
-    return part1(entire_grid)
-
-with open('input/day15.txt') as f:
-    lines = [line.rstrip('\n') for line in f.readlines()]
-    lines = [list(map(int, row)) for row in lines]
-    print(part1(lines))
-    print(part2(lines))
\ No newline at end of file
+    return dijkstra(grid, 0, len(grid) - 1, queue)
+
+def part2(grid : Grid, queue : str = 'dial') -> int:
+    ''' Solve part 2 '''
+    ## the tile in row R and column C of the entire cave is the grid incremented R + C times
+    tiles = [grid]
+    for _ in range(8):
+        tiles.append(repeat(tiles[-1]))
+
+    rows = []
+    for tile_row in range(5):
+        for r in range(grid.m):
+            rows.append(b''.join(tiles[tile_row + tile_column].row(r) for tile_column in range(5)))
+
+    return part1(Grid(5 * grid.m, 5 * grid.n, b''.join(rows)), queue)
+
+def parse(f : TextIO) -> Tuple[Grid]:
+    ''' Parse the puzzle input into the arguments taken by each part. '''
+    return (char_grid(f.read()),)
+
+if __name__ == '__main__':
+    with open('input/day15.txt') as f:
+        args = parse(f)
+    print(part1(*args))
+    print(part2(*args))
\ No newline at end of file
@@ -1,6 +1,7 @@
 import operator
 from dataclasses import dataclass
 from functools import reduce
+from typing import Tuple, TextIO
 
 @dataclass
 class Packet:
@@ -80,21 +81,30 @@ def part2(transmission : str) -> int:
     ''' Solve part 2 '''
     return packet_data(make_bits_from(transmission), 0).value
 
-with open('input/day16.txt') as f:
-    lines = [line.rstrip('\n') for line in f.readlines()]
-    print(part1(lines[0]))
-    print(part2(lines[0]))
+def solve_both(transmission : str) -> Tuple[int, int]:
+    ''' Solve both parts from a single decoding of the transmission. '''
+    packet = packet_data(make_bits_from(transmission), 0)
+    return packet.version, packet.value
 
-## Test cases
-assert part1('8A004A801A8002F478') == 16
-assert part1('620080001611562C8802118E34') == 12
-assert part1('C0015000016115A2E0802F182340') == 23
-assert part1('A0016C880162017C3686B18A3D4780') == 31
-assert part2('C200B40A82') == 3
-assert part2('04005AC33890') == 54
-assert part2('880086C3E88112') == 7
-assert part2('CE00C43D881120') == 9
-assert part2('D8005AC2A8F0') == 1
-assert part2('F600BC2D8F') == 0
-assert part2('9C005AC2F8F0') == 0
-assert part2('9C0141080250320F1802104A08') == 1
\ No newline at end of file
+def parse(f : TextIO) -> Tuple[str]:
+    ''' Parse the puzzle input into the arguments taken by each part. '''
+    return (f.read().strip(),)
+
+if __name__ == '__main__':
+    with open('input/day16.txt') as f:
+        args = parse(f)
+    print(part1(*args))
+    print(part2(*args))
+    ## Test cases
+    assert part1('8A004A801A8002F478') == 16
+    assert part1('620080001611562C8802118E34') == 12
+    assert part1('C0015000016115A2E0802F182340') == 23
+    assert part1('A0016C880162017C3686B18A3D4780') == 31
+    assert part2('C200B40A82') == 3
+    assert part2('04005AC33890') == 54
+    assert part2('880086C3E88112') == 7
+    assert part2('CE00C43D881120') == 9
+    assert part2('D8005AC2A8F0') == 1
+    assert part2('F600BC2D8F') == 0
+    assert part2('9C005AC2F8F0') == 0
+    assert part2('9C0141080250320F1802104A08') == 1
\ No newline at end of file
@@ -1,11 +1,13 @@
+from typing import Iterator, Tuple, TextIO
+
+from parsing import ints
+
 def summation(n : int) -> int:
     ''' Closed form summation formula for integers 1..n '''
     return (n * (n + 1)) // 2
 
-def part1(x_start : int, x_end : int, y_start : int, y_end : int) -> int:
-    ''' Solve part 1 '''
-    ans = 0
-
+def hits(x_start : int, x_end : int, y_start : int, y_end : int) -> Iterator[Tuple[int, int]]:
+    ''' Generate every initial velocity whose trajectory lands in the target area at some step. '''
     for x in range(x_end + 1):
         # Assuming y_start <= y_end < 0, idk otherwise
         for y in range(y_start, -(y_start - 1) + 1):
@@ -13,34 +15,36 @@ def part1(x_start : int, x_end : int, y_start : int, y_end : int) -> int:
             curr_x = curr_y = 0
             while vy >= 0 or curr_y >= y_start:
                 if x_start <= curr_x <= x_end and y_start <= curr_y <= y_end:
-                    ans = max(ans, summation(y))
+                    yield x, y
+                    break
                 curr_x, curr_y = curr_x + vx, curr_y + vy
                 vx, vy = max(0, vx - 1), vy - 1
-    
-    return ans
+
+def part1(x_start : int, x_end : int, y_start : int, y_end : int) -> int:
+    ''' Solve part 1 '''
+    return max((summation(y) for _x, y in hits(x_start, x_end, y_start, y_end)), default=0)
 
 def part2(x_start : int, x_end : int, y_start : int, y_end : int) -> int:
     ''' Solve part 2 '''
-    ans = set()
+    return sum(1 for _velocity in hits(x_start, x_end, y_start, y_end))
 
-    for x in range(x_end + 1):
-        # Assuming y_start <= y_end < 0, idk otherwise
-        for y in range(y_start, -(y_start - 1) + 1):
-            vx, vy = x, y
-            curr_x = curr_y = 0
-            while vy >= 0 or curr_y >= y_start:
-                if x_start <= curr_x <= x_end and y_start <= curr_y <= y_end:
-                    ans.add((x, y))
-                curr_x, curr_y = curr_x + vx, curr_y + vy
-                vx, vy = max(0, vx - 1), vy - 1
-    
-    return len(ans)
+def solve_both(x_start : int, x_end : int, y_start : int, y_end : int) -> Tuple[int, int]:
+    ''' Solve both parts from a single search of the initial velocities. '''
+    highest = count = 0
+    for _x, y in hits(x_start, x_end, y_start, y_end):
+        highest = max(highest, summation(y))
+        count += 1
+
+    return highest, count
 
-with open('input/day17.txt') as f:
-    vars = [line.rstrip('\n') for line in f.readlines()][0]
-    vars = vars.replace('target area: x=', '').replace('..', ',').replace(' y=', '')
-    print(part1(*map(int, vars.split(','))))
-    print(part2(*map(int, vars.split(','))))
+def parse(f : TextIO) -> Tuple[int, int, int, int]:
+    ''' Parse the puzzle input into the arguments taken by each part. '''
+    return tuple(ints(f.read()))
 
-assert part1(20, 30, -10, -5) == 45
-assert part2(20, 30, -10, -5) == 112
\ No newline at end of file
+if __name__ == '__main__':
+    with open('input/day17.txt') as f:
+        args = parse(f)
+    print(part1(*args))
+    print(part2(*args))
+    assert part1(20, 30, -10, -5) == 45
+    assert part2(20, 30, -10, -5) == 112
\ No newline at end of file
@@ -1,5 +1,7 @@
 from functools import reduce
-from typing import Iterable, Union, List, Tuple
+from typing import Iterable, Union, List, Tuple, TextIO
+
+from parsing import nested_lists
 
 Expression = Union[Iterable['Expression'], int]
 INT_TYPE = type(0)
@@ -109,29 +111,34 @@ def part2(exps : List[Expression]) -> int:
 
     return ans
 
-with open('input/day18.txt') as f:
-    lines = [eval(line.rstrip('\n')) for line in f.readlines()]
-    print(part1(lines))
-    print(part2(lines))
-
-assert magnitude([[1,2],[[3,4],5]]) == 143
-assert magnitude([[[[0,7],4],[[7,8],[6,0]]],[8,1]]) == 1384
-assert magnitude([[[[1,1],[2,2]],[3,3]],[4,4]]) == 445
-assert magnitude([[[[3,0],[5,3]],[4,4]],[5,5]]) == 791
-assert magnitude([[[[5,0],[7,4]],[5,5]],[6,6]]) == 1137
-assert magnitude([[[[8,7],[7,7]],[[8,6],[7,7]]],[[[0,7],[6,6]],[8,7]]]) == 3488
-
-assert explode([[[[[4,3],4],4],[7,[[8,4],9]]],[1,1]]) == [[[[0,7],4],[7,[[8,4],9]]],[1,1]]
-assert explode([[[[0,7],4],[7,[[8,4],9]]],[1,1]]) == [[[[0,7],4],[15,[0,13]]],[1,1]]
-assert explode([[[[0,7],4],[[7,8],[0,[6,7]]]],[1,1]]) == [[[[0,7],4],[[7,8],[6,0]]],[8,1]]
-assert explode([[[[[9,8],1],2],3],4]) == [[[[0,9],2],3],4]
-assert explode([7,[6,[5,[4,[3,2]]]]]) == [7,[6,[5,[7,0]]]]
-assert explode([[6,[5,[4,[3,2]]]],1]) == [[6,[5,[7,0]]],3]
-assert explode([[3,[2,[1,[7,3]]]],[6,[5,[4,[3,2]]]]]) == [[3,[2,[8,0]]],[9,[5,[4,[3,2]]]]]
-assert explode([[3,[2,[8,0]]],[9,[5,[4,[3,2]]]]]) == [[3,[2,[8,0]]],[9,[5,[7,0]]]]
-
-assert split([[[[0,7],4],[15,[0,13]]],[1,1]]) == [[[[0,7],4],[[7,8],[0,13]]],[1,1]]
-assert split([[[[0,7],4],[[7,8],[0,13]]],[1,1]]) == [[[[0,7],4],[[7,8],[0,[6,7]]]],[1,1]]
-
-assert simplify([[[[[4,3],4],4],[7,[[8,4],9]]],[1,1]]) == [[[[0,7],4],[[7,8],[6,0]]],[8,1]]
-assert simplify([[[[0,[4,5]],[0,0]],[[[4,5],[2,6]],[9,5]]], [7,[[[3,7],[4,3]],[[6,3],[8,8]]]]]) == [[[[4,0],[5,4]],[[7,7],[6,0]]],[[8,[7,7]],[[7,9],[5,0]]]]
\ No newline at end of file
+def parse(f : TextIO) -> Tuple[List[Expression]]:
+    ''' Parse the puzzle input into the arguments taken by each part. '''
+    return (nested_lists(f.read()),)
+
+if __name__ == '__main__':
+    with open('input/day18.txt') as f:
+        args = parse(f)
+    print(part1(*args))
+    print(part2(*args))
+
+    assert magnitude([[1,2],[[3,4],5]]) == 143
+    assert magnitude([[[[0,7],4],[[7,8],[6,0]]],[8,1]]) == 1384
+    assert magnitude([[[[1,1],[2,2]],[3,3]],[4,4]]) == 445
+    assert magnitude([[[[3,0],[5,3]],[4,4]],[5,5]]) == 791
+    assert magnitude([[[[5,0],[7,4]],[5,5]],[6,6]]) == 1137
+    assert magnitude([[[[8,7],[7,7]],[[8,6],[7,7]]],[[[0,7],[6,6]],[8,7]]]) == 3488
+
+    assert explode([[[[[4,3],4],4],[7,[[8,4],9]]],[1,1]]) == [[[[0,7],4],[7,[[8,4],9]]],[1,1]]
+    assert explode([[[[0,7],4],[7,[[8,4],9]]],[1,1]]) == [[[[0,7],4],[15,[0,13]]],[1,1]]
+    assert explode([[[[0,7],4],[[7,8],[0,[6,7]]]],[1,1]]) == [[[[0,7],4],[[7,8],[6,0]]],[8,1]]
+    assert explode([[[[[9,8],1],2],3],4]) == [[[[0,9],2],3],4]
+    assert explode([7,[6,[5,[4,[3,2]]]]]) == [7,[6,[5,[7,0]]]]
+    assert explode([[6,[5,[4,[3,2]]]],1]) == [[6,[5,[7,0]]],3]
+    assert explode([[3,[2,[1,[7,3]]]],[6,[5,[4,[3,2]]]]]) == [[3,[2,[8,0]]],[9,[5,[4,[3,2]]]]]
+    assert explode([[3,[2,[8,0]]],[9,[5,[4,[3,2]]]]]) == [[3,[2,[8,0]]],[9,[5,[7,0]]]]
+
+    assert split([[[[0,7],4],[15,[0,13]]],[1,1]]) == [[[[0,7],4],[[7,8],[0,13]]],[1,1]]
+    assert split([[[[0,7],4],[[7,8],[0,13]]],[1,1]]) == [[[[0,7],4],[[7,8],[0,[6,7]]]],[1,1]]
+
+    assert simplify([[[[[4,3],4],4],[7,[[8,4],9]]],[1,1]]) == [[[[0,7],4],[[7,8],[6,0]]],[8,1]]
+    assert simplify([[[[0,[4,5]],[0,0]],[[[4,5],[2,6]],[9,5]]], [7,[[[3,7],[4,3]],[[6,3],[8,8]]]]]) == [[[[4,0],[5,4]],[[7,7],[6,0]]],[[8,[7,7]],[[7,9],[5,0]]]]
\ No newline at end of file
@@ -1,7 +1,9 @@
-from typing import List, Tuple
+from typing import List, Tuple, TextIO
 from itertools import product, combinations
 from collections import Counter, deque
 
+from parsing import blocks, int_records
+
 Point3D = Tuple[int, int, int]
 
 def rotate(beacon : Point3D, rx : int, ry : int, rz : int) -> Point3D:
@@ -28,7 +30,7 @@ def manhattan(a : Point3D, b : Point3D) -> Point3D:
     ''' Manhattan distance of two 3D points. '''
     return sum(abs(a_elt - b_elt) for a_elt, b_elt in zip(a, b))
 
-def solve(beacons : List[List[Point3D]]) -> None:
+def solve_both(beacons : List[List[Point3D]]) -> Tuple[int, int]:
     ''' Solve part 1 and part 2, code reuse or doing them separately takes too long! '''
     points = set()
 
@@ -57,17 +59,23 @@ def solve(beacons : List[List[Point3D]]) -> None:
 
     part1 = len(points)
     part2 = max(manhattan(a, b) for a, b in combinations(abs_posn.values(), r=2))
-    print(part1)
-    print(part2)
-
-with open('input/day19.txt') as f:
-    lines = [line.rstrip('\n') for line in f.readlines()]
-
-    beacons = []
-    for i, line in enumerate(lines):
-        if line.startswith('---'):
-            beacons.append([])
-        elif len(line) > 0:
-            beacons[-1].append(tuple(map(int, line.split(','))))
-    
-    solve(beacons)
\ No newline at end of file
+    return part1, part2
+
+def part1(beacons : List[List[Point3D]]) -> int:
+    ''' Solve part 1 '''
+    return solve_both(beacons)[0]
+
+def part2(beacons : List[List[Point3D]]) -> int:
+    ''' Solve part 2 '''
+    return solve_both(beacons)[1]
+
+def parse(f : TextIO) -> Tuple[List[List[Point3D]]]:
+    ''' Parse the puzzle input into the arguments taken by each part. '''
+    ## drop the '--- scanner N ---' header of every block before reading its beacons
+    return ([int_records(block.split('\n', 1)[1], 3) for block in blocks(f.read())],)
+
+if __name__ == '__main__':
+    with open('input/day19.txt') as f:
+        args = parse(f)
+    for answer in solve_both(*args):
+        print(answer)
\ No newline at end of file
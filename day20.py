@@ -1,59 +1,64 @@
-from itertools import product
-from typing import List
+from typing import List, Tuple, TextIO
 
-Grid = List[str]
+from grid import Grid
+from parsing import blocks, char_grid
+
+def row_codes(row : bytes) -> List[int]:
+    ''' The 3-bit codes of every three consecutive pixels in a row, read left to right. '''
+    return [(a << 2) | (b << 1) | c for a, b, c in zip(row, row[1:], row[2:])]
 
 def enhance(algorithm : str, image : Grid, parity : int, parity_matters : bool) -> Grid:
-    ''' Create a new enchanced image given an existing image (ignoring infinite borders). '''
-    m, n = len(image), len(image[0])
-    new_image = [['.' for _ in range(n + 2)] for _ in range(m + 2)]
-
-    def get_cell(i : int, j : int) -> str:
-        ''' Get value of cell from old image, guarding against out of bounds.
-            If we are on an odd iteration and the 0-index of the algorithm indicates a #, be careful! '''
-        if 0 <= i < m and 0 <= j < n:
-            return image[i][j]
-        elif parity_matters:
-            return '.' if parity % 2 == 0 else '#'
-        else:
-            return '.'
-
-    def map_cell(kernel : Grid) -> str:
-        ''' Find new value of cell from 3x3 convolution kernel from algorithm string. '''
-        kernel = ''.join(kernel)
-        kernel = ''.join(str(int(c == '#')) for c in kernel)
-        return algorithm[int(kernel, 2)]
-
-    for i, j in product(range(m + 2), range(n + 2)):
-        kernel = [['.', '.', '.'], ['.', '.', '.'], ['.', '.', '.']]
-        kernel[0][0] = get_cell(i - 2, j - 2)
-        kernel[0][1] = get_cell(i - 2, j - 1)
-        kernel[0][2] = get_cell(i - 2, j)
-        kernel[1][0] = get_cell(i - 1, j - 2)
-        kernel[1][1] = get_cell(i - 1, j - 1)
-        kernel[1][2] = get_cell(i - 1, j)
-        kernel[2][0] = get_cell(i, j - 2)
-        kernel[2][1] = get_cell(i, j - 1)
-        kernel[2][2] = get_cell(i, j)
-        new_image[i][j] = map_cell([''.join(row) for row in kernel])
-
-    return [''.join(row) for row in new_image]
+    ''' Create a new enchanced image given an existing image (ignoring infinite borders).
+        If we are on an odd iteration and the 0-index of the algorithm indicates a #, the border is lit, be careful! '''
+    m, n = image.m, image.n
+    lookup = bytes(c == '#' for c in algorithm)
+    background = parity % 2 if parity_matters else 0
+
+    ## pad the image with two pixels of infinite border, so every kernel of the new image lies within it
+    border = bytes([background]) * (n + 4)
+    padded = [border, border]
+    padded.extend(bytes([background, background]) + row + bytes([background, background]) for row in image.rows())
+    padded.extend([border, border])
+
+    ## the 9-bit kernel code is the 3-bit codes of three rows stacked on top of each other
+    codes = [row_codes(row) for row in padded]
+    new_image = Grid(m + 2, n + 2)
+    for i, new_row in enumerate(new_image.rows()):
+        new_row[:] = bytes(lookup[(top << 6) | (middle << 3) | bottom]
+            for top, middle, bottom in zip(codes[i], codes[i + 1], codes[i + 2]))
+
+    return new_image
 
 def part1(algorithm : str, image : Grid) -> int:
     ''' Solve part 1 '''
     parity_matters = (algorithm[0] == '#')
     i1 = enhance(algorithm, image, 0, parity_matters)
     i2 = enhance(algorithm, i1, 1, parity_matters)
-    return ''.join(i2).count('#')
+    return sum(i2.cells)
 
 def part2(algorithm : str, image : Grid) -> int:
     ''' Solve part 2 '''
     parity_matters = (algorithm[0] == '#')
     for i in range(50):
         image = enhance(algorithm, image, i, parity_matters)
-    return ''.join(image).count('#')
+    return sum(image.cells)
+
+def solve_both(algorithm : str, image : Grid) -> Tuple[int, int]:
+    ''' Solve both parts, part 2 carrying on enhancing from where part 1 stopped. '''
+    parity_matters = (algorithm[0] == '#')
+    for i in range(50):
+        image = enhance(algorithm, image, i, parity_matters)
+        if i == 1:
+            lit_after_two = sum(image.cells)
+    return lit_after_two, sum(image.cells)
+
+def parse(f : TextIO) -> Tuple[str, Grid]:
+    ''' Parse the puzzle input into the arguments taken by each part. '''
+    algorithm, image = blocks(f.read())
+    return (algorithm, char_grid(image, '.#'))
 
-with open('input/day20.txt') as f:
-    lines = [line.rstrip('\n') for line in f.readlines()]
-    print(part1(lines[0], lines[2:]))
-    print(part2(lines[0], lines[2:]))
\ No newline at end of file
+if __name__ == '__main__':
+    with open('input/day20.txt') as f:
+        args = parse(f)
+    print(part1(*args))
+    print(part2(*args))
\ No newline at end of file
@@ -1,14 +1,21 @@
-from functools import lru_cache
+from collections import Counter
 from itertools import product
-from typing import Tuple
+from typing import Tuple, TextIO
+
+from memo import memoize
+from parsing import ints
 
 def incr_dice(dice : int) -> int:
     ''' Increment the next roll of a deterministic dice. '''
     return dice % 100 + 1
 
-def add(a : Tuple[int, int], b : Tuple[int, int]) -> Tuple[int, int]:
-    ''' Add two tuples element-wise. '''
-    return [a[0] + b[0], a[1] + b[1]]
+def add(a : Tuple[int, int], b : Tuple[int, int], times : int = 1) -> Tuple[int, int]:
+    ''' Add two tuples element-wise, the second one the given number of times. '''
+    return (a[0] + times * b[0], a[1] + times * b[1])
+
+def pack_state(p1_posn : int, p2_posn : int, p1_score : int, p2_score : int, p1_move : bool) -> int:
+    ''' Pack a game state into a single int (positions are at most 10, scores at most 30) to key the memo by. '''
+    return ((((p1_posn << 4 | p2_posn) << 5 | p1_score) << 5 | p2_score) << 1) | p1_move
 
 def move_player(posn : int, x : int) -> int:
     ''' Returns the new position of the player after moving x spots. '''
@@ -45,38 +52,43 @@ def part1(p1_posn : int, p2_posn : int) -> int:
 
 def part2(p1_posn : int, p2_posn : int) -> int:
     ''' Solve part 2 '''
-    move_combinations = list(product(range(1, 4), range(1, 4), range(1, 4)))
+    ## the 27 universes of every turn only move the player by 7 different totals
+    move_totals = Counter(map(sum, product(range(1, 4), range(1, 4), range(1, 4))))
 
-    @lru_cache(None)
+    ## every state (scores up to 30) fits, so nothing is ever evicted
+    @memoize(max_size=10 * 10 * 31 * 31 * 2, key=pack_state, eviction='fifo')
     def dp(p1_posn : int, p2_posn : int, p1_score : int, p2_score : int, p1_move : bool) -> Tuple[int, int]:
         ''' Tuple indicating how many times [p1 won, p2 won] given both player positions, scores, and whose turn it is. '''
         if p1_score >= 21:
-            return [1, 0]
+            return (1, 0)
 
         if p2_score >= 21:
-            return [0, 1]
+            return (0, 1)
 
-        wins = [0, 0]
+        wins = (0, 0)
 
         if p1_move:
-            for moves in move_combinations:
-                new_p1_posn = move_player(p1_posn, sum(moves))
-                wins = add(wins, dp(new_p1_posn, p2_posn, p1_score + new_p1_posn, p2_score, False))
+            for total, universes in move_totals.items():
+                new_p1_posn = move_player(p1_posn, total)
+                wins = add(wins, dp(new_p1_posn, p2_posn, p1_score + new_p1_posn, p2_score, False), universes)
         else:
-            for moves in move_combinations:
-                new_p2_posn = move_player(p2_posn, sum(moves))
-                wins = add(wins, dp(p1_posn, new_p2_posn, p1_score, p2_score + new_p2_posn, True))
+            for total, universes in move_totals.items():
+                new_p2_posn = move_player(p2_posn, total)
+                wins = add(wins, dp(p1_posn, new_p2_posn, p1_score, p2_score + new_p2_posn, True), universes)
 
-        return [wins[0], wins[1]]
+        return wins
 
     return max(dp(p1_posn, p2_posn, 0, 0, True))
 
-with open('input/day21.txt') as f:
-    lines = [line.rstrip('\n') for line in f.readlines()]
-    p1_start = int(lines[0][-2:])
-    p2_start = int(lines[1][-2:])
-    print(part1(p1_start, p2_start))
-    print(part2(p1_start, p2_start))
-
-assert part1(4, 8) == 739785
-assert part2(4, 8) == 444356092776315
\ No newline at end of file
+def parse(f : TextIO) -> Tuple[int, int]:
+    ''' Parse the puzzle input into the arguments taken by each part. '''
+    _player_1, start_1, _player_2, start_2 = ints(f.read())
+    return (start_1, start_2)
+
+if __name__ == '__main__':
+    with open('input/day21.txt') as f:
+        args = parse(f)
+    print(part1(*args))
+    print(part2(*args))
+    assert part1(4, 8) == 739785
+    assert part2(4, 8) == 444356092776315
\ No newline at end of file
@@ -1,8 +1,12 @@
-from typing import List, Tuple, Set
+from typing import List, Tuple, Set, TextIO
 from functools import reduce
 
+from parsing import records
+
 Cube = Tuple[str, int, int, int, int, int, int]
 
+CUBE = r'(on|off) x=(-?\d+)\.\.(-?\d+),y=(-?\d+)\.\.(-?\d+),z=(-?\d+)\.\.(-?\d+)'
+
 def part1(given_cubes : List[Cube]) -> int:
     ''' Solve part 1 '''
     cube = [[[False] * 101 for _ in range(101)] for _ in range(101)]
@@ -76,17 +80,16 @@ def part2(given_cubes : List[Cube]) -> int:
 
     return net_volume
 
-with open('input/day22.txt') as f:
-    lines = [line.rstrip('\n') for line in f.readlines()]
-
+def parse(f : TextIO) -> Tuple[List[Cube]]:
+    ''' Parse the puzzle input into the arguments taken by each part. '''
     cubes = []
-    for line in lines:
-        state = line[:3].strip()
-        x, y, z = line[3:].strip().split(',')
-        cubes.append((state, 
-            *map(int, x[2:].split('..')), 
-            *map(int, y[2:].split('..')), 
-            *map(int, z[2:].split('..'))))
-
-    print(part1(cubes))
-    print(part2(cubes))
\ No newline at end of file
+    for state, *bounds in records(f.read(), CUBE):
+        cubes.append((state, *map(int, bounds)))
+
+    return (cubes,)
+
+if __name__ == '__main__':
+    with open('input/day22.txt') as f:
+        args = parse(f)
+    print(part1(*args))
+    print(part2(*args))
\ No newline at end of file
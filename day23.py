@@ -1,6 +1,8 @@
-from typing import List, Tuple
+from typing import List, Tuple, TextIO
 from collections import defaultdict
-from heapdict import heapdict
+
+from parsing import lines
+from pqueue import new_queue
 
 Grid = List[List[str]]
 Edge = Tuple[int, str]
@@ -80,19 +82,21 @@ def get_neis(grid : Grid, height : int) -> List[Edge]:
     
     return neis
 
-def dijkstra(height : int, start : str, end : str) -> int:
-    ''' Dijkstra's algorithm without a graph, just finding neighbors until we reach the end with least cost! '''
+def dijkstra(height : int, start : str, end : str, queue : str = 'heapq') -> int:
+    ''' Dijkstra's algorithm without a graph, just finding neighbors until we reach the end with least cost!
+        A move takes at most height + 10 steps of up to 1000 energy each, which would take a bucket queue tens of
+        thousands of mostly empty buckets, so by default this uses a binary heap. '''
     dists = defaultdict(lambda: float('inf'))
     dists[start] = 0
     
-    # Let Q be a new heap
-    Q = heapdict()
-    Q[start] = 0
+    # Let Q be a new priority queue
+    Q = new_queue(queue, max_weight=(height + 10) * 1000)
+    Q.push(start, 0)
     visited = set()
 
     while True:
         # extract min
-        u, dists[u] = Q.popitem()
+        u, dists[u] = Q.pop()
         visited.add(u)
         if u == end:
             return dists[u]
@@ -101,35 +105,31 @@ def dijkstra(height : int, start : str, end : str) -> int:
         for cost, v in get_neis(unflatten(u), height):
             if v not in visited:
                 if dists[v] > dists[u] + cost:
-                    Q[v] = dists[v] = dists[u] + cost
+                    dists[v] = dists[u] + cost
+                    Q.push(v, dists[v])
+
+def organize(grid : Grid, queue : str = 'heapq') -> int:
+    ''' Least energy needed to organize a burrow, whatever the depth of its rooms (see pqueue for the queues). '''
+    height = len(grid) - 2
+    grid_done = ['#############', '#...........#', '###A#B#C#D###'] + ['  #A#B#C#D#  '] * (height - 2) + ['  #########  ']
+    return dijkstra(height, flatten(grid), flatten(grid_done), queue)
 
 def part1(grid : Grid) -> int:
     ''' Solve part 1 '''
-    grid_done = [
-        '#############',
-        '#...........#',
-        '###A#B#C#D###',
-        '  #A#B#C#D#  ',
-        '  #########  '
-    ]
-    return dijkstra(3, flatten(grid), flatten(grid_done))
+    return organize(grid)
 
 def part2(grid : Grid) -> int:
     ''' Solve part 1 '''
     grid.insert(3, '  #D#C#B#A#  ')
     grid.insert(4, '  #D#B#A#C#  ')
-    grid_done = [
-        '#############',
-        '#...........#',
-        '###A#B#C#D###',
-        '  #A#B#C#D#  ',
-        '  #A#B#C#D#  ',
-        '  #A#B#C#D#  ',
-        '  #########  '
-    ]
-    return dijkstra(5, flatten(grid), flatten(grid_done))
-
-with open('input/day23.txt') as f:
-    grid = [line.rstrip('\n').ljust(13) for line in f.readlines()]
-    print(part1(grid))
-    print(part2(grid))
\ No newline at end of file
+    return organize(grid)
+
+def parse(f : TextIO) -> Tuple[Grid]:
+    ''' Parse the puzzle input into the arguments taken by each part. '''
+    return ([line.ljust(13) for line in lines(f)],)
+
+if __name__ == '__main__':
+    with open('input/day23.txt') as f:
+        args = parse(f)
+    print(part1(*args))
+    print(part2(*args))
\ No newline at end of file
@@ -1,12 +1,19 @@
-import z3
-from typing import List
+from typing import List, Tuple, TextIO, TYPE_CHECKING
 
-digits = [z3.BitVec(f'd_{i}', 64) for i in range(14)]
-z3_zero, z3_one = z3.BitVecVal(0, 64), z3.BitVecVal(1, 64)
+from parsing import lines
 
-def get_constraints(insns : List[str]) -> z3.Optimize:
-    ''' Add constraints after processing each instructions into a Z3 constraint solver (cheating).
+if TYPE_CHECKING:
+    import z3
+
+def get_constraints(insns : List[str]) -> Tuple['z3.Optimize', List['z3.BitVecRef']]:
+    ''' Add constraints after processing each instructions into a Z3 constraint solver (cheating), returning it
+        along with the model number's digits. z3 takes a while to import, so it is only imported here.
         Referenced u/roboputin: https://www.reddit.com/r/adventofcode/comments/rnejv5/comment/hpshymr ''' 
+    import z3
+
+    digits = [z3.BitVec(f'd_{i}', 64) for i in range(14)]
+    z3_zero, z3_one = z3.BitVecVal(0, 64), z3.BitVecVal(1, 64)
+
     constraints = z3.Optimize()
     registers = {'w': z3_zero, 'x': z3_zero, 'y': z3_zero, 'z': z3_zero}
     digit_input = digits[::-1]
@@ -42,11 +49,11 @@ def get_constraints(insns : List[str]) -> z3.Optimize:
 
     ## the last value of z must be 0
     constraints.add(registers['z'] == z3_zero)
-    return constraints
+    return constraints, digits
 
 def get_optimal(insns : List[str], direction : str) -> int:
     ''' Get the optimal answer in either extreme. '''
-    solver = get_constraints(insns)
+    solver, digits = get_constraints(insns)
     digit_sum = sum((10 ** i) * d for i, d in enumerate(digits[::-1]))
 
     if direction == 'max':
@@ -69,7 +76,12 @@ def part2(insns : List[str]) -> int:
     ''' Solve part 2 '''
     return get_optimal(insns, 'min')
 
-with open('input/day24.txt') as f:
-    lines = [line.rstrip('\n') for line in f.readlines()]
-    print(part1(lines))
-    print(part2(lines))
\ No newline at end of file
+def parse(f : TextIO) -> Tuple[List[str]]:
+    ''' Parse the puzzle input into the arguments taken by each part. '''
+    return (lines(f),)
+
+if __name__ == '__main__':
+    with open('input/day24.txt') as f:
+        args = parse(f)
+    print(part1(*args))
+    print(part2(*args))
\ No newline at end of file
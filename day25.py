@@ -1,76 +1,41 @@
-from typing import List, Tuple
-from itertools import product
+from typing import Tuple, TextIO
 
-Grid = List[List[str]]
-Point = Tuple[int, int]
+from grid import Grid
+from parsing import char_grid
 
-def move_down(grid : Grid, i : int, j : int) -> Point:
-    ''' Return new location after trying to move a sea cucumber down. '''
-    m = len(grid)
-    new_i, new_j = (i + 1) % m, j
-    if grid[new_i][new_j] == '.':
-        return (new_i, new_j)
-    else:
-        return (i, j)
+EMPTY, EAST, SOUTH = 0, 1, 2
 
-def move_right(grid : Grid, i : int, j : int) -> Point:
-    ''' Return new location after trying to move a sea cucumber right. '''
-    n = len(grid[0])
-    new_i, new_j = i, (j + 1) % n
-    if grid[new_i][new_j] == '.':
-        return (new_i, new_j)
-    else:
-        return (i, j)
+def move_herd(grid : Grid, herd : int, ahead : Tuple[int, ...]) -> bool:
+    ''' Simultaneously move every sea cucumber of a herd whose spot ahead is empty, and report if any moved. '''
+    cells = grid.cells
+    movers = [i for i, cell in enumerate(cells) if cell == herd and cells[ahead[i]] == EMPTY]
 
-def part1(grid : Grid) -> int:
-    ''' Solve part 1 '''
-    m, n = len(lines), len(lines[0])
-
-    steps = 0
-    has_moved = True
-    while has_moved:
-        has_moved = False
-        prev_rights = set()
-        rights = set()
-
-        for i, j in product(range(m), range(n)):
-            if grid[i][j] == '>':
-                prev_rights.add((i, j))
-                if move_right(grid, i, j) != (i, j):
-                    has_moved = True
-                rights.add(move_right(grid, i, j))
-
-        for i, j in prev_rights:
-            grid[i][j] = '.'
-
-        for i, j in rights:
-            grid[i][j] = '>'
+    for i in movers:
+        cells[i] = EMPTY
+        cells[ahead[i]] = herd
 
-        prev_downs = set()
-        downs = set()
+    return bool(movers)
 
-        for i, j in product(range(m), range(n)):
-            if grid[i][j] == 'v':
-                prev_downs.add((i, j))
-                if move_down(grid, i, j) != (i, j):
-                    has_moved = True
-                downs.add(move_down(grid, i, j))
-
-        for i, j in prev_downs:
-            grid[i][j] = '.'
-
-        for i, j in downs:
-            grid[i][j] = 'v'
+def part1(grid : Grid) -> int:
+    ''' Solve part 1 '''
+    right, down = grid.shifted(0, 1, wrap=True), grid.shifted(1, 0, wrap=True)
 
-        steps += has_moved
+    steps = 1
+    while move_herd(grid, EAST, right) | move_herd(grid, SOUTH, down):
+        steps += 1
 
-    return steps + 1
+    return steps
 
-def part2() -> str:
+def part2(_grid : Grid) -> str:
     ''' Solve part 2 '''
     return 'Click on \'Remotely Start The Sleigh Again\'!'
 
-with open('input/day25.txt') as f:
-    lines = [list(line.rstrip('\n')) for line in f.readlines()]
-    print(part1(lines))
-    print(part2())
\ No newline at end of file
+def parse(f : TextIO) -> Tuple[Grid]:
+    ''' Parse the puzzle input into the arguments taken by each part. '''
+    return (char_grid(f.read(), '.>v'),)
+
+if __name__ == '__main__':
+    with open('input/day25.txt') as f:
+        args = parse(f)
+    print(part1(*args))
+    print(part2(*args))
\ No newline at end of file
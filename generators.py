@@ -0,0 +1,352 @@
+''' Seeded generators of synthetic puzzle inputs, so every day can be benchmarked at sizes beyond its real input.
+
+    Every generator takes a size and a random number generator and returns the text of an input file,
+    in the same format as the real one under input/. '''
+import string
+from random import Random
+from typing import Callable, Dict, List, Tuple
+
+from grid import Grid
+
+## Segments lit by each seven-segment digit
+SEGMENTS = ['abcefg', 'cf', 'acdeg', 'acdfg', 'bcdf', 'abdfg', 'abdefg', 'acf', 'abcdefg', 'abcdfg']
+BRACKETS = {'(': ')', '[': ']', '{': '}', '<': '>'}
+
+def digit_grid(m : int, n : int, rng : Random, digits : str = string.digits) -> str:
+    ''' A random m x n grid of the given digits. '''
+    return '\n'.join(''.join(rng.choice(digits) for _ in range(n)) for _ in range(m))
+
+def day01(size : int, rng : Random) -> str:
+    ''' Sonar depth readings: a random walk downwards. '''
+    depth, readings = 100, []
+    for _ in range(size):
+        depth = max(0, depth + rng.randint(-10, 20))
+        readings.append(depth)
+    return '\n'.join(map(str, readings))
+
+def day02(size : int, rng : Random) -> str:
+    ''' Submarine commands, going down more often than up. '''
+    directions = rng.choices(['forward', 'down', 'up'], weights=[4, 3, 2], k=size)
+    return '\n'.join(f'{direction} {rng.randint(1, 9)}' for direction in directions)
+
+def day03(size : int, rng : Random) -> str:
+    ''' Distinct binary numbers, at least 12 bits wide. Any prefix shared by several numbers is followed by
+        both a 0 and a 1 somewhere, otherwise the rating filters would discard every number. '''
+
+    def numbers(prefix : int, count : int, bits : int) -> List[int]:
+        ''' Numbers of the given bit length (after the prefix) that keep branching until they are unique. '''
+        if count == 1:
+            return [(prefix << bits) | rng.randrange(1 << bits)]
+        capacity = 1 << (bits - 1)
+        zeros = rng.randint(max(1, count - capacity), min(capacity, count - 1))
+        return numbers(prefix << 1, zeros, bits - 1) + numbers((prefix << 1) | 1, count - zeros, bits - 1)
+
+    width = max(12, size.bit_length() + 1)
+    report = numbers(0, size, width)
+    rng.shuffle(report)
+    return '\n'.join(format(num, f'0{width}b') for num in report)
+
+def day04(size : int, rng : Random) -> str:
+    ''' All of 0..99 drawn in random order, followed by the given number of boards. '''
+    draws = list(range(100))
+    rng.shuffle(draws)
+    sections = [','.join(map(str, draws))]
+    for _ in range(size):
+        cells = rng.sample(range(100), 25)
+        sections.append('\n'.join(' '.join(f'{cell:>2}' for cell in cells[r:r + 5]) for r in range(0, 25, 5)))
+    return '\n\n'.join(sections)
+
+def day05(size : int, rng : Random) -> str:
+    ''' Horizontal, vertical and diagonal vents on a 1000 x 1000 field. '''
+    vents = []
+    for _ in range(size):
+        x1, y1 = rng.randrange(1000), rng.randrange(1000)
+        kind = rng.randrange(3)
+        if kind == 0:
+            x2, y2 = x1, rng.randrange(1000)
+        elif kind == 1:
+            x2, y2 = rng.randrange(1000), y1
+        else:
+            slope = rng.choice([1, -1])
+            low = max(-x1, -y1 if slope == 1 else y1 - 999)
+            high = min(999 - x1, 999 - y1 if slope == 1 else y1)
+            length = rng.randint(low, high)
+            x2, y2 = x1 + length, y1 + slope * length
+        vents.append(f'{x1},{y1} -> {x2},{y2}')
+    return '\n'.join(vents)
+
+def day06(size : int, rng : Random) -> str:
+    ''' Lanternfish timers. '''
+    return ','.join(str(rng.randint(1, 5)) for _ in range(size))
+
+def day07(size : int, rng : Random) -> str:
+    ''' Crab positions spread over twice as many positions as there are crabs. '''
+    return ','.join(str(rng.randrange(2 * size)) for _ in range(size))
+
+def day08(size : int, rng : Random) -> str:
+    ''' Scrambled seven-segment display entries. '''
+    entries = []
+    for _ in range(size):
+        wiring = dict(zip('abcdefg', rng.sample('abcdefg', 7)))
+        scramble = lambda digit: ''.join(rng.sample([wiring[s] for s in SEGMENTS[digit]], len(SEGMENTS[digit])))
+        signals = [scramble(digit) for digit in rng.sample(range(10), 10)]
+        outputs = [scramble(rng.randrange(10)) for _ in range(4)]
+        entries.append(' '.join(signals) + ' | ' + ' '.join(outputs))
+    return '\n'.join(entries)
+
+def day09(size : int, rng : Random) -> str:
+    ''' A square heightmap where roughly a fifth of the cells are basin-separating 9s. '''
+    return digit_grid(size, size, rng, '012345678' * 2 + '99')
+
+def day10(size : int, rng : Random) -> str:
+    ''' Navigation subsystem lines, about half of them corrupted and the rest incomplete. '''
+    lines = []
+    for i in range(size):
+        line, stack = [], []
+        corrupt_at = rng.randrange(20, 100) if i % 2 else -1
+        for j in range(rng.randrange(80, 110)):
+            if j == corrupt_at and stack:
+                line.append(rng.choice([c for c in BRACKETS.values() if c != BRACKETS[stack[-1]]]))
+            elif stack and rng.random() < 0.45:
+                line.append(BRACKETS[stack.pop()])
+            else:
+                stack.append(rng.choice(list(BRACKETS)))
+                line.append(stack[-1])
+        lines.append(''.join(line))
+    return '\n'.join(lines)
+
+def day11(size : int, rng : Random) -> str:
+    ''' A square grid of octopus energy levels which all flash together within 500 steps. '''
+    ## imported here, so benchmarking day 11 still times its own import
+    from day11 import step
+
+    while True:
+        grid = Grid.from_rows([[rng.randint(3, 9) for _ in range(size)] for _ in range(size)])
+        trial = grid.copy()
+        if any(step(trial) == size * size for _ in range(500)):
+            return '\n'.join(grid.to_lines())
+
+def day12(size : int, rng : Random) -> str:
+    ''' A cave system with the given number of small caves and a big cave for every four of them. '''
+    small = ['start', 'end'] + [''.join(rng.sample(string.ascii_lowercase, 2)) + str(i) for i in range(size)]
+    big = [''.join(rng.sample(string.ascii_uppercase, 2)) + str(i) for i in range(max(1, size // 4))]
+    edges = set()
+    for cave in small:
+        ## big caves are never adjacent, otherwise there would be infinitely many paths
+        edges.add((cave, rng.choice(big)))
+        edges.add(tuple(rng.sample(small, 2)))
+    return '\n'.join(f'{u}-{v}' for u, v in sorted(edges))
+
+def day13(size : int, rng : Random) -> str:
+    ''' Transparent paper that folds down (size times along x and size + 2 times along y) to 40 x 6 dots. '''
+    x_folds, y_folds = [40], [6]
+    for _ in range(size - 1):
+        x_folds.append(2 * x_folds[-1] + 1)
+    for _ in range(size + 1):
+        y_folds.append(2 * y_folds[-1] + 1)
+    width, height = 2 * x_folds[-1] + 1, 2 * y_folds[-1] + 1
+
+    dots = {(width - 1, height - 1)}
+    while len(dots) < width * height // 1300:
+        dots.add((rng.randrange(width), rng.randrange(height)))
+
+    ## folds along the same axis happen from the outside in, but the axes are interleaved at random
+    axes = ['x'] * len(x_folds) + ['y'] * len(y_folds)
+    rng.shuffle(axes)
+    remaining = {'x': x_folds, 'y': y_folds}
+    folds = [f'fold along {axis}={remaining[axis].pop()}' for axis in axes]
+    return '\n'.join(f'{x},{y}' for x, y in dots) + '\n\n' + '\n'.join(folds)
+
+def day14(size : int, rng : Random) -> str:
+    ''' A polymer template and insertion rules for every pair over an alphabet of the given size. '''
+    alphabet = string.ascii_uppercase[:size]
+    template = ''.join(rng.choice(alphabet) for _ in range(20))
+    rules = [f'{a}{b} -> {rng.choice(alphabet)}' for a in alphabet for b in alphabet]
+    return template + '\n\n' + '\n'.join(rules)
+
+def day15(size : int, rng : Random) -> str:
+    ''' A square grid of risk levels. '''
+    return digit_grid(size, size, rng, '123456789')
+
+def day16(size : int, rng : Random) -> str:
+    ''' A BITS transmission made up of roughly the given number of packets. '''
+
+    def packet(num_packets : int, depth : int) -> str:
+        ''' Bits of a random packet tree with about the given number of packets. '''
+        version = format(rng.randrange(8), '03b')
+        if num_packets <= 1 or depth >= 20:
+            value = format(rng.randrange(1 << 12), 'b')
+            value = value.zfill(-(-len(value) // 4) * 4)
+            groups = [value[i:i + 4] for i in range(0, len(value), 4)]
+            return version + '100' + ''.join(('1' if i < len(groups) - 1 else '0') + g for i, g in enumerate(groups))
+
+        type_id = rng.choice([0, 1, 2, 3, 5, 6, 7])
+        fanout = 2 if type_id >= 5 else rng.randint(1, min(8, num_packets - 1))
+        shares = [(num_packets - 1) // fanout] * fanout
+        subpackets = ''.join(packet(share, depth + 1) for share in shares)
+        if len(subpackets) < 1 << 15 and rng.random() < 0.5:
+            return version + format(type_id, '03b') + '0' + format(len(subpackets), '015b') + subpackets
+        return version + format(type_id, '03b') + '1' + format(fanout, '011b') + subpackets
+
+    bits = packet(size, 0)
+    bits += '0' * (-len(bits) % 4)
+    return ''.join(format(int(bits[i:i + 4], 2), 'X') for i in range(0, len(bits), 4))
+
+def day17(size : int, rng : Random) -> str:
+    ''' A target area below and to the right of the probe, reaching down to y = -size. '''
+    x_start = rng.randint(2 * size, 3 * size)
+    return f'target area: x={x_start}..{x_start + size // 3}, y={-size}..{-size + size // 3}'
+
+def day18(size : int, rng : Random) -> str:
+    ''' Reduced snailfish numbers. '''
+
+    def number(depth : int):
+        ''' A random snailfish number nested at most four pairs deep. '''
+        if depth == 4 or (depth > 1 and rng.random() < 0.3):
+            return rng.randrange(10)
+        return [number(depth + 1), number(depth + 1)]
+
+    return '\n'.join(str(number(0)).replace(' ', '') for _ in range(size))
+
+def day19(size : int, rng : Random) -> str:
+    ''' A chain of scanners, each sharing at least 12 beacons with the one before it. '''
+    from day19 import rotate
+
+    scanners = [(0, 0, 0)]
+    for _ in range(size - 1):
+        scanners.append(tuple(coord + rng.randint(-1100, 1100) for coord in scanners[-1]))
+
+    beacons = set()
+    for a, b in zip(scanners, scanners[1:]):
+        low = [max(a_coord, b_coord) - 1000 for a_coord, b_coord in zip(a, b)]
+        high = [min(a_coord, b_coord) + 1000 for a_coord, b_coord in zip(a, b)]
+        for _ in range(12):
+            beacons.add(tuple(rng.randint(l, h) for l, h in zip(low, high)))
+    for scanner in scanners:
+        for _ in range(4):
+            beacons.add(tuple(coord + rng.randint(-1000, 1000) for coord in scanner))
+
+    reports = []
+    for i, scanner in enumerate(scanners):
+        rotation = (rng.randrange(4), rng.randrange(4), rng.randrange(4)) if i else (0, 0, 0)
+        seen = [tuple(b - s for b, s in zip(beacon, scanner)) for beacon in beacons]
+        seen = [rotate(beacon, *rotation) for beacon in seen if max(map(abs, beacon)) <= 1000]
+        reports.append(f'--- scanner {i} ---\n' + '\n'.join(','.join(map(str, beacon)) for beacon in seen))
+    return '\n\n'.join(reports)
+
+def day20(size : int, rng : Random) -> str:
+    ''' An enhancement algorithm that flips the infinite background, and a square image. '''
+    algorithm = ['#'] + [rng.choice('#.') for _ in range(510)] + ['.']
+    return ''.join(algorithm) + '\n\n' + digit_grid(size, size, rng, '#.')
+
+def day21(size : int, rng : Random) -> str:
+    ''' Starting positions of both players (the game has no size to scale). '''
+    return f'Player 1 starting position: {rng.randint(1, 10)}\nPlayer 2 starting position: {rng.randint(1, 10)}'
+
+def day22(size : int, rng : Random) -> str:
+    ''' Reboot steps: a few in the initialization region followed by large cuboids. '''
+    steps = []
+    for i in range(size):
+        bound, extent = (50, 50) if i < size // 20 + 1 else (100000, 60000)
+        ranges = []
+        for axis in 'xyz':
+            low = rng.randint(-bound, bound - 1)
+            ranges.append(f'{axis}={low}..{rng.randint(low, min(bound, low + extent))}')
+        steps.append(f'{"on" if i < 2 or rng.random() < 0.6 else "off"} ' + ','.join(ranges))
+    return '\n'.join(steps)
+
+def day23(size : int, rng : Random) -> str:
+    ''' A burrow whose rooms are each the given number of amphipods deep. It is scrambled by undoing random legal
+        moves from the organized burrow, so that it can always be organized again. '''
+    doors = {'A': 2, 'B': 4, 'C': 6, 'D': 8}
+    stops = [0, 1, 3, 5, 7, 9, 10]
+    hallway = [None] * 11
+    rooms = dict((kind, [kind] * size) for kind in doors)
+
+    def path_clear(start : int, end : int) -> bool:
+        ''' Is the hallway free from just after start up to and including end? '''
+        step = 1 if end > start else -1
+        return all(hallway[i] is None for i in range(start + step, end + step, step))
+
+    def unmoves(leaving : bool) -> List[Tuple[str, int]]:
+        ''' Reverse moves: hallway to any room (undoing leaving a room), and, if wanted, out of a room holding
+            only its own kind (undoing entering it). '''
+        found = [(kind, h) for h in stops for kind in doors if hallway[h] is not None
+            and len(rooms[kind]) < size and path_clear(h, doors[kind])]
+        if leaving:
+            found += [(kind, h) for kind in doors for h in stops if rooms[kind] and set(rooms[kind]) == {kind}
+                and hallway[h] is None and path_clear(doors[kind], h)]
+        return found
+
+    for _ in range(30 * size):
+        found = unmoves(leaving=True)
+        if not found:
+            break
+        kind, h = rng.choice(found)
+        if hallway[h] is None:
+            hallway[h] = rooms[kind].pop()
+        else:
+            rooms[kind].append(hallway[h])
+            hallway[h] = None
+
+    ## then keep moving amphipods back into rooms until the hallway is empty
+    while any(hallway):
+        kind, h = rng.choice(unmoves(leaving=False))
+        rooms[kind].append(hallway[h])
+        hallway[h] = None
+
+    rows = [[rooms[kind][depth] for kind in doors] for depth in reversed(range(size))]
+    lines = ['#############', '#...........#', '###' + '#'.join(rows[0]) + '###']
+    lines += ['  #' + '#'.join(row) + '#' for row in rows[1:]]
+    return '\n'.join(lines + ['  #########'])
+
+def day24(size : int, rng : Random) -> str:
+    ''' A MONAD program with a valid model number: seven digits pushed onto z and seven popped back off. '''
+    blocks = [None] * 14
+    pushes = []
+    order = ['push'] * 7 + ['pop'] * 7
+    ## make sure the push/pop sequence stays balanced
+    while True:
+        rng.shuffle(order)
+        depth = 0
+        for op in order:
+            depth += 1 if op == 'push' else -1
+            if depth < 0:
+                break
+        else:
+            break
+
+    for i, op in enumerate(order):
+        if op == 'push':
+            blocks[i] = (1, rng.randint(10, 15), rng.randint(1, 16))
+            pushes.append(i)
+        else:
+            offset = rng.randint(-8, 8)
+            blocks[i] = (26, offset - blocks[pushes.pop()][2], rng.randint(1, 16))
+
+    program = []
+    for div, check, add in blocks:
+        program += ['inp w', 'mul x 0', 'add x z', 'mod x 26', f'div z {div}', f'add x {check}', 'eql x w',
+            'eql x 0', 'mul y 0', 'add y 25', 'mul y x', 'add y 1', 'mul z y', 'mul y 0', 'add y w',
+            f'add y {add}', 'mul y x', 'add z y']
+    return '\n'.join(program)
+
+def day25(size : int, rng : Random) -> str:
+    ''' A square sea floor crowded enough with sea cucumbers that they eventually jam. '''
+    return digit_grid(size, size, rng, '>>>vvv....')
+
+GENERATORS : Dict[int, Callable[[int, Random], str]] = dict((day, globals()[f'day{day:02d}']) for day in range(1, 26))
+
+## Input sizes each day is benchmarked at, from smallest to largest
+SIZES : Dict[int, List[int]] = {
+    1: [2000, 20000, 200000], 2: [1000, 10000, 100000], 3: [1000, 10000, 100000], 4: [100, 1000, 5000],
+    5: [250, 500, 1000], 6: [300, 3000, 30000], 7: [250, 500, 1000], 8: [200, 2000, 20000],
+    9: [50, 100, 200], 10: [100, 1000, 10000], 11: [10, 20, 40], 12: [4, 6, 8],
+    13: [3, 4, 5], 14: [4, 10, 26], 15: [10, 25, 50], 16: [100, 1000, 5000],
+    17: [25, 50, 100], 18: [25, 50, 100], 19: [4, 8, 16], 20: [10, 25, 50],
+    21: [1], 22: [100, 400, 1600], 23: [2, 3, 4], 24: [14], 25: [25, 50, 100],
+}
+
+def generate(day : int, size : int, seed : int = 0) -> str:
+    ''' Generate a day's input of the given size, always the same for the same seed. '''
+    return GENERATORS[day](size, Random(f'{day}-{size}-{seed}'))
@@ -0,0 +1,118 @@
+''' A compact grid type shared by the grid puzzles.
+
+    Cells hold small non-negative integers (0 to 255) and are stored row-major in one flat bytearray, so cell
+    (r, c) of an m x n grid lives at index r * n + c. Instead of bounds-checking neighbors in hot loops, solvers
+    look them up in tables precomputed once per grid shape. '''
+from functools import lru_cache
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+DIGITS = '0123456789'
+
+## Offsets of the 4-connected neighbors, and of the extra diagonal ones of the 8-connected neighbors
+ORTHOGONAL = ((1, 0), (0, 1), (-1, 0), (0, -1))
+DIAGONAL = ((1, 1), (-1, -1), (1, -1), (-1, 1))
+
+@lru_cache(maxsize=16)
+def neighbor_table(m : int, n : int, diagonal : bool = False, wrap : bool = False) -> Tuple[Tuple[int, ...], ...]:
+    ''' For every cell index of an m x n grid, the indices of its 4-connected (or 8-connected) neighbors.
+        Without wraparound, neighbors that would fall off the grid are left out. '''
+    offsets = ORTHOGONAL + DIAGONAL if diagonal else ORTHOGONAL
+    table = []
+    for r in range(m):
+        for c in range(n):
+            neis = []
+            for dr, dc in offsets:
+                nr, nc = r + dr, c + dc
+                if wrap:
+                    neis.append((nr % m) * n + (nc % n))
+                elif 0 <= nr < m and 0 <= nc < n:
+                    neis.append(nr * n + nc)
+            table.append(tuple(neis))
+
+    return tuple(table)
+
+@lru_cache(maxsize=16)
+def shift_table(m : int, n : int, dr : int, dc : int, wrap : bool = False) -> Tuple[int, ...]:
+    ''' For every cell index of an m x n grid, the index of the cell dr rows down and dc columns right of it
+        (-1 if that falls off the grid and there is no wraparound). '''
+    table = []
+    for r in range(m):
+        for c in range(n):
+            nr, nc = r + dr, c + dc
+            if wrap:
+                table.append((nr % m) * n + (nc % n))
+            else:
+                table.append(nr * n + nc if 0 <= nr < m and 0 <= nc < n else -1)
+
+    return tuple(table)
+
+class Grid:
+    ''' An m x n grid of small integers in a flat, row-major bytearray. '''
+    def __init__(self, m : int, n : int, cells : Optional[bytes] = None, fill : int = 0) -> None:
+        ''' Constructor from the cells in row-major order, or filled with a single value. '''
+        self.m, self.n = m, n
+        self.cells = bytearray(cells) if cells is not None else bytearray([fill]) * (m * n)
+        if len(self.cells) != m * n:
+            raise ValueError(f'expected {m * n} cells for a {m} x {n} grid, got {len(self.cells)}')
+
+    @classmethod
+    def from_rows(cls, rows : Sequence[Sequence[int]]) -> 'Grid':
+        ''' Grid from a list of rows of integers. '''
+        return cls(len(rows), len(rows[0]), bytes(cell for row in rows for cell in row))
+
+    @classmethod
+    def from_lines(cls, lines : Sequence[str], alphabet : str = DIGITS) -> 'Grid':
+        ''' Grid from lines of characters, every cell holding the index of its character in the alphabet. '''
+        table = str.maketrans(alphabet, ''.join(map(chr, range(len(alphabet)))))
+        return cls(len(lines), len(lines[0]), ''.join(lines).translate(table).encode('latin-1'))
+
+    def to_lines(self, alphabet : str = DIGITS) -> List[str]:
+        ''' Lines of characters, the opposite of from_lines. '''
+        table = bytes.maketrans(bytes(range(len(alphabet))), alphabet.encode('latin-1'))
+        return [bytes(row).translate(table).decode('latin-1') for row in self.rows()]
+
+    def index(self, r : int, c : int) -> int:
+        ''' Flat index of cell (r, c). '''
+        return r * self.n + c
+
+    def position(self, i : int) -> Tuple[int, int]:
+        ''' Cell (r, c) at a flat index. '''
+        return divmod(i, self.n)
+
+    def __getitem__(self, position : Tuple[int, int]) -> int:
+        r, c = position
+        return self.cells[r * self.n + c]
+
+    def __setitem__(self, position : Tuple[int, int], value : int) -> None:
+        r, c = position
+        self.cells[r * self.n + c] = value
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __eq__(self, other : object) -> bool:
+        return isinstance(other, Grid) and (self.m, self.n, self.cells) == (other.m, other.n, other.cells)
+
+    def __repr__(self) -> str:
+        return f'Grid({self.m}, {self.n}, {bytes(self.cells)!r})'
+
+    def row(self, r : int) -> memoryview:
+        ''' Zero-copy view of a row, writes to which change the grid. '''
+        return memoryview(self.cells)[r * self.n:(r + 1) * self.n]
+
+    def rows(self) -> Iterator[memoryview]:
+        ''' Zero-copy views of all rows. '''
+        view = memoryview(self.cells)
+        return (view[i:i + self.n] for i in range(0, len(self.cells), self.n))
+
+    def neighbors(self, diagonal : bool = False, wrap : bool = False) -> Tuple[Tuple[int, ...], ...]:
+        ''' Neighbor table of this grid's shape, see neighbor_table. '''
+        return neighbor_table(self.m, self.n, diagonal, wrap)
+
+    def shifted(self, dr : int, dc : int, wrap : bool = False) -> Tuple[int, ...]:
+        ''' Shift table of this grid's shape, see shift_table. '''
+        return shift_table(self.m, self.n, dr, dc, wrap)
+
+    def copy(self) -> 'Grid':
+        ''' A copy of the grid, sharing nothing with it. '''
+        return Grid(self.m, self.n, self.cells)
@@ -0,0 +1,82 @@
+''' Bounded memoization for the recursive solvers, counting how well every cache works.
+
+    Unlike functools.lru_cache(None), a memo holds at most max_size results (evicting the least recently used or the
+    oldest), can key them by a compact hashable made from the arguments (like an int packing a whole game state), and records
+    hits, misses, evictions and the largest size it reached. Counters are kept per function name, summed over every
+    memo made for that name (a solver's inner function gets a new memo on every call), so the runner can report
+    them per day. '''
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional
+
+DEFAULT_MAX_SIZE = 1 << 16
+
+@dataclass
+class MemoStats:
+    ''' Counters of all memos of one function. '''
+    max_size: int
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    peak_size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        ''' Fraction of calls answered from the cache. '''
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+## Counters of every memoized function since the last reset, by qualified name
+STATS : Dict[str, MemoStats] = dict()
+
+def memoize(max_size : int = DEFAULT_MAX_SIZE, key : Optional[Callable[..., Hashable]] = None,
+        eviction : str = 'lru') -> Callable[[Callable], Callable]:
+    ''' Decorator caching a function's results by its positional arguments (or by what key makes of them). Once
+        max_size results are cached, every new one evicts the least recently used (eviction='lru') or the oldest
+        (eviction='fifo', which saves reordering the cache on every hit). The cache itself is the wrapper's cache
+        attribute and its counters its stats attribute. '''
+    if eviction not in ('lru', 'fifo'):
+        raise ValueError(f'unknown eviction policy: {eviction}')
+
+    def decorator(func : Callable) -> Callable:
+        name = f'{func.__module__}.{func.__qualname__.replace(".<locals>", "")}'
+        ## the counters are shared by every memo of this function
+        stats = STATS.setdefault(name, MemoStats(max_size))
+        cache = OrderedDict() if eviction == 'lru' else dict()
+
+        @wraps(func)
+        def memoized(*args : Any) -> Any:
+            cache_key = key(*args) if key else args
+            try:
+                value = cache[cache_key]
+            except KeyError:
+                pass
+            else:
+                if eviction == 'lru':
+                    cache.move_to_end(cache_key)
+                stats.hits += 1
+                return value
+
+            value = func(*args)
+            stats.misses += 1
+            cache[cache_key] = value
+            if len(cache) > max_size:
+                del cache[next(iter(cache))]
+                stats.evictions += 1
+            elif len(cache) > stats.peak_size:
+                stats.peak_size = len(cache)
+            return value
+
+        memoized.cache, memoized.stats = cache, stats
+        return memoized
+    return decorator
+
+def reset_stats() -> None:
+    ''' Zero the counters of every memoized function. '''
+    for stats in STATS.values():
+        stats.hits = stats.misses = stats.evictions = stats.peak_size = 0
+
+def snapshot() -> Dict[str, MemoStats]:
+    ''' A copy of the counters of every memoized function called since the last reset. '''
+    return dict((name, MemoStats(**vars(stats))) for name, stats in STATS.items() if stats.hits or stats.misses)
\ No newline at end of file
@@ -0,0 +1,48 @@
+''' Helpers shared by the days' parse functions.
+
+    Each reads its input with a single f.read() and extracts everything in bulk (with str.split, str.splitlines and
+    compiled regular expressions, which loop in C) rather than line by line with readlines() and rstrip(). '''
+import json
+import re
+from typing import Any, List, TextIO, Tuple
+
+from grid import DIGITS, Grid
+
+INT = re.compile(r'-?\d+')
+
+## Turns every ASCII character that can't be part of an integer into a space
+SEPARATORS = str.maketrans(dict((chr(c), ' ') for c in range(128) if chr(c) not in '-0123456789'))
+
+def lines(f : TextIO) -> List[str]:
+    ''' All lines of the input, without their newlines. '''
+    return f.read().splitlines()
+
+def blocks(text : str) -> List[str]:
+    ''' The blocks of the input separated by blank lines. '''
+    return text.strip('\n').split('\n\n')
+
+def ints(text : str) -> List[int]:
+    ''' Every integer in the text, in order, ignoring whatever separates them. '''
+    try:
+        ## splitting is about twice as fast as the regular expression, but fails on a '-' that isn't a minus sign,
+        ## so the arrows separating day 5's records are removed first
+        return list(map(int, text.replace('->', ' ').translate(SEPARATORS).split()))
+    except ValueError:
+        return list(map(int, INT.findall(text)))
+
+def int_records(text : str, width : int) -> List[Tuple[int, ...]]:
+    ''' Every integer in the text, grouped into tuples of width consecutive integers. '''
+    values = ints(text)
+    return list(zip(*[iter(values)] * width))
+
+def records(text : str, pattern : str) -> List[Tuple[str, ...]]:
+    ''' The groups of every match of a regular expression, such as one matching a whole line. '''
+    return re.findall(pattern, text)
+
+def char_grid(text : str, alphabet : str = DIGITS) -> Grid:
+    ''' A grid with one cell per character of every non-empty line, see Grid.from_lines. '''
+    return Grid.from_lines([line for line in text.splitlines() if line], alphabet)
+
+def nested_lists(text : str) -> List[Any]:
+    ''' Every line parsed as a (nested) JSON list, all in a single call to the decoder. '''
+    return json.loads('[' + ','.join(line for line in text.splitlines() if line) + ']')
\ No newline at end of file
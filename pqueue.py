@@ -0,0 +1,99 @@
+''' Priority queues for the shortest path searches (days 15 and 23), all with the same small interface:
+    push(item, priority) adds an item or lowers its priority, pop() removes and returns the item with the lowest
+    priority along with that priority, and len() counts the items queued.
+
+    - LazyHeapQueue: a heapq heap where lowering a priority just pushes the item again, stale entries being skipped
+      when they come up. Pushing is O(log n) with no pop-and-repush, and entries are tuples rather than lists.
+    - BucketQueue: Dial's algorithm, a circular array of buckets indexed by priority. Needs integer priorities that
+      never drop below the last one popped nor exceed it by more than max_weight, as in Dijkstra's algorithm with
+      integer edge weights of at most max_weight. Pushing and popping are O(1) (amortized over the buckets).
+    - HeapDictQueue: the heapdict package behind the same interface, for comparison. '''
+import heapq
+from itertools import count
+from typing import Any, Hashable, Optional, Tuple
+
+class LazyHeapQueue:
+    ''' Binary heap with lazy deletion of entries whose priority was lowered since they were pushed. '''
+    def __init__(self, max_weight : Optional[int] = None) -> None:
+        ''' Constructor for an empty queue, max_weight is only there for the interface. '''
+        self.heap = []
+        self.best = dict()
+        ## ties are broken by insertion order, so items never need to be comparable
+        self.counter = count()
+
+    def push(self, item : Hashable, priority : int) -> None:
+        ''' Add an item, or lower its priority if it is already queued with a higher one. '''
+        if priority < self.best.get(item, float('inf')):
+            self.best[item] = priority
+            heapq.heappush(self.heap, (priority, next(self.counter), item))
+
+    def pop(self) -> Tuple[Hashable, int]:
+        ''' Remove the item with the lowest priority, returning it and its priority. '''
+        while True:
+            priority, _order, item = heapq.heappop(self.heap)
+            if self.best.get(item) == priority:
+                del self.best[item]
+                return item, priority
+
+    def __len__(self) -> int:
+        return len(self.best)
+
+class BucketQueue:
+    ''' Dial's bucket queue for monotone integer priorities within max_weight of the last one popped. '''
+    def __init__(self, max_weight : int) -> None:
+        ''' Constructor for an empty queue. '''
+        self.buckets = [[] for _ in range(max_weight + 1)]
+        self.best = dict()
+        self.current = 0
+
+    def push(self, item : Hashable, priority : int) -> None:
+        ''' Add an item, or lower its priority if it is already queued with a higher one. '''
+        if priority < self.best.get(item, float('inf')):
+            if not self.current <= priority < self.current + len(self.buckets):
+                raise ValueError(f'priority {priority} is out of range of the buckets from {self.current}')
+            self.best[item] = priority
+            self.buckets[priority % len(self.buckets)].append(item)
+
+    def pop(self) -> Tuple[Hashable, int]:
+        ''' Remove the item with the lowest priority, returning it and its priority. '''
+        if not self.best:
+            raise IndexError('pop from an empty bucket queue')
+
+        while True:
+            bucket = self.buckets[self.current % len(self.buckets)]
+            while bucket:
+                item = bucket.pop()
+                if self.best.get(item) == self.current:
+                    del self.best[item]
+                    return item, self.current
+            self.current += 1
+
+    def __len__(self) -> int:
+        return len(self.best)
+
+class HeapDictQueue:
+    ''' The heapdict package, whose decrease-key pops and re-pushes the item, behind the same interface. '''
+    def __init__(self, max_weight : Optional[int] = None) -> None:
+        ''' Constructor for an empty queue, max_weight is only there for the interface. '''
+        from heapdict import heapdict
+        self.heap = heapdict()
+
+    def push(self, item : Hashable, priority : int) -> None:
+        ''' Add an item, or lower its priority if it is already queued with a higher one. '''
+        if priority < self.heap.get(item, float('inf')):
+            self.heap[item] = priority
+
+    def pop(self) -> Tuple[Hashable, int]:
+        ''' Remove the item with the lowest priority, returning it and its priority. '''
+        return self.heap.popitem()
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+QUEUES = {'heapq': LazyHeapQueue, 'dial': BucketQueue, 'heapdict': HeapDictQueue}
+
+def new_queue(kind : str, max_weight : Optional[int] = None) -> Any:
+    ''' An empty priority queue of the given kind (see QUEUES); bucket queues need the largest edge weight. '''
+    if kind == 'dial' and max_weight is None:
+        raise ValueError('a bucket queue needs the largest edge weight')
+    return QUEUES[kind](max_weight)
\ No newline at end of file
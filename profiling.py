@@ -0,0 +1,92 @@
+''' Profile a day's solvers, leaving out parsing and imports, and save reports of where the time (and memory) goes.
+
+    For every part this writes:
+    - <prefix>.txt: per-function statistics from cProfile, sorted (by own time by default)
+    - <prefix>.prof: the raw cProfile statistics, for pstats or viewers like snakeviz
+    - <prefix>.collapsed: sampled call stacks in the folded format of flamegraph.pl and speedscope '''
+import cProfile
+import os
+import pstats
+import signal
+import sys
+import tracemalloc
+from collections import Counter
+from copy import deepcopy
+from types import FrameType, ModuleType
+from typing import Any, Callable, List, Sequence, Tuple
+
+SAMPLE_INTERVAL = 0.001
+
+def frame_name(frame : FrameType) -> str:
+    ''' Name of the function running in a frame, qualified by its module and any enclosing functions. '''
+    code = frame.f_code
+    name = getattr(code, 'co_qualname', code.co_name).replace('.<locals>', '')
+    return f'{frame.f_globals.get("__name__", "?")}.{name}'
+
+def sample_stacks(func : Callable, *args : Any, interval : float = SAMPLE_INTERVAL) -> Tuple[Any, Counter]:
+    ''' Call a function while sampling its call stack every interval seconds of CPU time (Unix only).
+        Returns its result and how many samples landed in each stack, as ';'-joined function names. '''
+    stacks = Counter()
+    base = sys._getframe()
+
+    def on_sample(_signum : int, frame : FrameType) -> None:
+        ''' Record the interrupted stack, up to the frame that called the function. '''
+        names = []
+        while frame is not None and frame is not base:
+            names.append(frame_name(frame))
+            frame = frame.f_back
+        stacks[';'.join(reversed(names))] += 1
+
+    previous = signal.signal(signal.SIGPROF, on_sample)
+    signal.setitimer(signal.ITIMER_PROF, interval, interval)
+    try:
+        result = func(*args)
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, previous)
+
+    return result, stacks
+
+def trace_memory(func : Callable, *args : Any) -> Tuple[Any, int, int]:
+    ''' Call a function under tracemalloc. Returns its result, the peak number of bytes it had allocated at once,
+        and the bytes it left allocated when it returned (including its result). '''
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    before, _peak = tracemalloc.get_traced_memory()
+    try:
+        result = func(*args)
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+    return result, peak - before, after - before
+
+def profile_part(func : Callable, args : Sequence[Any], prefix : str, sort : str = 'tottime') -> Any:
+    ''' Profile one solver call and write its reports next to prefix. The call is made twice, once under cProfile
+        and once sampled for the flame graph, so neither skews the other. Returns the solver's answer. '''
+    profiler = cProfile.Profile()
+    answer = profiler.runcall(func, *deepcopy(args))
+    profiler.dump_stats(prefix + '.prof')
+    with open(prefix + '.txt', 'w') as f:
+        pstats.Stats(profiler, stream=f).sort_stats(sort).print_stats()
+
+    _answer, stacks = sample_stacks(func, *deepcopy(args))
+    with open(prefix + '.collapsed', 'w') as f:
+        for stack, count in sorted(stacks.items()):
+            f.write(f'{stack} {count}\n')
+
+    return answer
+
+def profile_day(module : ModuleType, args : Sequence[Any], parts : Sequence[str], directory : str, sort : str = 'tottime') -> List[str]:
+    ''' Profile the given parts of an already parsed day, returning the prefixes the reports were written to. '''
+    os.makedirs(directory, exist_ok=True)
+    prefixes = []
+    for part in parts:
+        prefix = os.path.join(directory, f'{module.__name__}_{part}')
+        profile_part(getattr(module, part), args, prefix, sort)
+        prefixes.append(prefix)
+
+    return prefixes
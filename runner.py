@@ -0,0 +1,284 @@
+''' Run any subset of the days through their common parse/part1/part2 interface, timing each phase. Days that
+    share work between their parts also have a solve_both, which is run instead of the two parts by default, and
+    line-oriented days have a stream solver that reads their input line by line in bounded memory.
+
+    Usage: python runner.py [DAY ...] [--jobs N] [--separate | --stream] [--no-cache] [--profile] '''
+import argparse
+import ast
+import importlib
+import os
+import sys
+import time
+from copy import deepcopy
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Sequence, TextIO, Tuple
+
+from cache import DEFAULT_MAX_BYTES, AnswerCache, digest
+from memo import MemoStats, reset_stats, snapshot
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DAYS = list(range(1, 26))
+PARTS = ('part1', 'part2')
+BOTH = 'solve_both'
+STREAM = 'stream'
+PHASES = ('import', 'parse') + PARTS + (BOTH, STREAM)
+
+## Importing a day should be cheap, heavy dependencies are only imported when they are needed
+IMPORT_BUDGET = 0.05
+
+@dataclass
+class DayResult:
+    ''' Answers and wall-clock timings (in seconds) of a single day's run, the counters of every memoized function
+        its solvers called, and if asked for, the peak and net bytes allocated by each part. '''
+    day: int
+    answers: Dict[str, Any] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)
+    peak_memory: Dict[str, int] = field(default_factory=dict)
+    net_memory: Dict[str, int] = field(default_factory=dict)
+    memo: Dict[str, MemoStats] = field(default_factory=dict)
+    cached: bool = False
+
+def module_name(day : int) -> str:
+    ''' Name of the module holding a day's solution. '''
+    return f'day{day:02d}'
+
+def input_path(day : int) -> str:
+    ''' Path of the puzzle input for a day. '''
+    return os.path.join(ROOT, 'input', f'{module_name(day)}.txt')
+
+def source_paths(day : int) -> List[str]:
+    ''' Paths of a day's module and of every module of this repository it imports, directly or not. '''
+    paths, pending = [], [module_name(day)]
+    while pending:
+        path = os.path.join(ROOT, f'{pending.pop()}.py')
+        if path in paths or not os.path.exists(path):
+            continue
+
+        paths.append(path)
+        with open(path) as f:
+            tree = ast.parse(f.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                pending.extend(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module:
+                pending.append(node.module)
+
+    return paths
+
+def cache_key(day : int) -> str:
+    ''' Key of a day's answers: changes whenever its puzzle input or any of its source does. '''
+    return digest([input_path(day)] + source_paths(day))
+
+def load(day : int) -> ModuleType:
+    ''' Import a day's module, which has no side effects outside of its __main__ block. '''
+    return importlib.import_module(module_name(day))
+
+def timed_load(day : int) -> Tuple[ModuleType, float]:
+    ''' Import a day's module, also returning how long that took (zero if it was already imported). '''
+    if module_name(day) in sys.modules:
+        return sys.modules[module_name(day)], 0.0
+
+    start = time.perf_counter()
+    module = load(day)
+    return module, time.perf_counter() - start
+
+def default_parts(module : ModuleType) -> Tuple[str, ...]:
+    ''' What to run to solve a day: its solve_both if it has one, otherwise both parts one after the other. '''
+    return (BOTH,) if hasattr(module, BOTH) else PARTS
+
+def run_day(day : int, f : Optional[TextIO] = None, parts : Optional[Sequence[str]] = None, memory : bool = False,
+        stream : bool = False) -> DayResult:
+    ''' Parse a day's input (its puzzle input unless another file is given) and solve the given parts (by default,
+        see default_parts), timing each phase separately. With memory, every part is solved a second time under
+        tracemalloc, which would otherwise slow down the timed run. With stream, days that have a stream solver
+        are solved by it straight from the file instead. '''
+    if f is None:
+        with open(input_path(day)) as f:
+            return run_day(day, f, parts, memory, stream)
+
+    result = DayResult(day)
+    module, result.timings['import'] = timed_load(day)
+
+    if stream and hasattr(module, STREAM):
+        start = time.perf_counter()
+        result.answers.update(zip(PARTS, module.stream(f)))
+        result.timings[STREAM] = time.perf_counter() - start
+
+        if memory:
+            from profiling import trace_memory
+            f.seek(0)
+            _answers, result.peak_memory[STREAM], result.net_memory[STREAM] = trace_memory(module.stream, f)
+        return result
+
+    start = time.perf_counter()
+    args = module.parse(f)
+    result.timings['parse'] = time.perf_counter() - start
+
+    for part in parts or default_parts(module):
+        ## some solvers mutate their arguments, so every part gets its own (untimed) copy
+        part_args = deepcopy(args)
+        reset_stats()
+        start = time.perf_counter()
+        answer = getattr(module, part)(*part_args)
+        result.timings[part] = time.perf_counter() - start
+        result.memo.update(snapshot())
+
+        if part == BOTH:
+            result.answers.update(zip(PARTS, answer))
+        else:
+            result.answers[part] = answer
+
+        if memory:
+            from profiling import trace_memory
+            part_args = deepcopy(args)
+            _answer, result.peak_memory[part], result.net_memory[part] = trace_memory(getattr(module, part), *part_args)
+
+    return result
+
+def run_parallel(days : Sequence[int], jobs : Optional[int] = None, memory : bool = False) -> List[DayResult]:
+    ''' Solve every (day, part) job of the given days in a pool of worker processes, collecting the answers and
+        timings as the jobs finish. Each job imports the day and parses its input itself. '''
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    results = dict((day, DayResult(day)) for day in days)
+
+    with ProcessPoolExecutor(jobs) as pool:
+        futures = [pool.submit(run_day, day, None, (part,), memory) for day in days for part in PARTS]
+        for future in as_completed(futures):
+            partial = future.result()
+            result = results[partial.day]
+            ## a worker that already imported the day reports no time for it, so the day's import is its slowest one
+            result.timings['import'] = max(result.timings.get('import', 0.0), partial.timings.pop('import'))
+            result.timings.setdefault('parse', partial.timings.pop('parse'))
+            result.timings.update(partial.timings)
+            result.answers.update(partial.answers)
+            result.peak_memory.update(partial.peak_memory)
+            result.net_memory.update(partial.net_memory)
+            result.memo.update(partial.memo)
+
+    return [results[day] for day in days]
+
+def format_ms(seconds : float) -> str:
+    ''' Format a duration in milliseconds for the report table. '''
+    return f'{seconds * 1000:.1f} ms'
+
+def format_bytes(size : int) -> str:
+    ''' Format a number of bytes in MiB for the report table. '''
+    return f'{size / (1 << 20):.2f} MiB'
+
+def format_report(results : List[DayResult]) -> str:
+    ''' Render the results as a table of timings (and memory use, if measured) and answers; multi-line answers are
+        listed below it. '''
+    ## only the solvers that were actually run get columns
+    solvers = [part for part in PHASES[2:] if any(part in result.timings for result in results)]
+    phases = PHASES[:2] + tuple(solvers)
+    memory_columns = [(f'{part} peak', part, 'peak_memory') for part in solvers] + [(f'{part} net', part, 'net_memory') for part in solvers]
+    if not any(result.peak_memory for result in results):
+        memory_columns = []
+
+    header = f'{"day":>3}' + ''.join(f'{phase:>13}' for phase in phases) + f'{"total":>13}'
+    header += ''.join(f'{title:>17}' for title, _part, _attr in memory_columns) + '  answers'
+    rows, extras = [header], []
+    totals = dict.fromkeys(phases, 0.0)
+
+    for result in results:
+        answers = []
+        for part in PARTS:
+            answer = str(result.answers.get(part))
+            if '\n' in answer:
+                extras.append(f'day {result.day} {part}:\n{answer}')
+                answer = '(see below)'
+            answers.append(answer)
+
+        row = f'{result.day:>3}'
+        if result.cached:
+            rows.append(row + f'{"cached":>13}' * (len(phases) + 1) + f'{"cached":>17}' * len(memory_columns) + '  ' + ' | '.join(answers))
+            continue
+
+        for phase in phases:
+            totals[phase] += result.timings.get(phase, 0.0)
+            row += f'{format_ms(result.timings.get(phase, 0.0)):>13}'
+        row += f'{format_ms(sum(result.timings.values())):>13}'
+        row += ''.join(f'{format_bytes(getattr(result, attr).get(part, 0)):>17}' for _title, part, attr in memory_columns)
+        rows.append(row + '  ' + ' | '.join(answers))
+
+    rows.append('all' + ''.join(f'{format_ms(totals[phase]):>13}' for phase in phases) + f'{format_ms(sum(totals.values())):>13}')
+    return '\n'.join(rows + extras)
+
+def format_memo(results : List[DayResult]) -> str:
+    ''' Render the counters of every memoized function called, one line per day and function. '''
+    rows = []
+    for result in results:
+        for name, stats in sorted(result.memo.items()):
+            rows.append(f'day {result.day} memo {name}: {stats.hits} hits, {stats.misses} misses ({stats.hit_rate:.1%} hit rate), '
+                        f'{stats.evictions} evictions, peak size {stats.peak_size}/{stats.max_size}')
+    return '\n'.join(rows)
+
+def main(argv : Optional[List[str]] = None) -> None:
+    ''' Command line entry point. '''
+    parser = argparse.ArgumentParser(description='Run and time Advent of Code 2021 solutions.')
+    parser.add_argument('days', metavar='DAY', type=int, nargs='*', default=DAYS, help='days to run (default: all)')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='worker processes to run (day, part) jobs in, 0 for one per CPU (default: 1)')
+    solvers = parser.add_mutually_exclusive_group()
+    solvers.add_argument('--separate', action='store_true', help='solve and time the two parts separately, even for days with a solve_both')
+    solvers.add_argument('--stream', action='store_true', help='solve the days that can from a stream of lines, in memory that does not grow with the input')
+    parser.add_argument('--no-cache', action='store_true', help='solve every day even if its answers are cached, and cache nothing')
+    parser.add_argument('--cache-max-bytes', type=int, default=DEFAULT_MAX_BYTES, help='size the answer cache is trimmed to')
+    parser.add_argument('--import-budget', type=float, default=IMPORT_BUDGET * 1000, help='warn about days that take longer than this to import, in ms (default: %(default)s)')
+    parser.add_argument('--memory', action='store_true', help='also measure the peak and net memory allocated by each part')
+    parser.add_argument('--profile', action='store_true', help='profile the parts of each day instead of timing them')
+    parser.add_argument('--profile-dir', default=os.path.join(ROOT, 'profiles'), help='where to write profiling reports')
+    parser.add_argument('--profile-sort', default='tottime', choices=['tottime', 'cumulative', 'ncalls'], help='order of the per-function reports')
+    args = parser.parse_args(argv)
+
+    for day in args.days:
+        if day not in DAYS:
+            parser.error(f'no such day: {day}')
+    if args.stream and args.jobs != 1:
+        parser.error('--stream solves every day in a single process')
+
+    if args.profile:
+        from profiling import profile_day
+        for day in args.days:
+            module = load(day)
+            with open(input_path(day)) as f:
+                parsed = module.parse(f)
+            parts = PARTS if args.separate else default_parts(module)
+            for prefix in profile_day(module, parsed, parts, args.profile_dir, args.profile_sort):
+                print(f'wrote {prefix}.txt, {prefix}.prof and {prefix}.collapsed')
+        return
+
+    start = time.perf_counter()
+    cache = None if args.no_cache else AnswerCache(max_bytes=args.cache_max_bytes)
+    results = dict()
+    ## measuring memory or another way of solving needs every day actually solved, cached answers would hide it
+    measuring = args.memory or args.stream or args.separate
+    if cache and not measuring:
+        for day in args.days:
+            answers = cache.get(cache_key(day))
+            if answers is not None:
+                results[day] = DayResult(day, answers, cached=True)
+
+    unsolved = [day for day in args.days if day not in results]
+    if args.jobs == 1:
+        solved = [run_day(day, None, PARTS if args.separate else None, args.memory, args.stream) for day in unsolved]
+    else:
+        solved = run_parallel(unsolved, args.jobs or None, args.memory)
+
+    for result in solved:
+        results[result.day] = result
+        if cache:
+            cache.put(cache_key(result.day), result.answers)
+
+    print(format_report([results[day] for day in args.days]))
+    print(f'wall time: {format_ms(time.perf_counter() - start)}')
+    if any(result.memo for result in solved):
+        print(format_memo(solved))
+
+    for result in solved:
+        if result.timings['import'] > args.import_budget / 1000:
+            print(f'warning: importing day {result.day} took {format_ms(result.timings["import"])}, over the budget of {args.import_budget:g} ms')
+
+if __name__ == '__main__':
+    main()